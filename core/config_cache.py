@@ -4,18 +4,35 @@
 实现基于文件修改时间的配置缓存机制，减少重复的YAML文件加载。
 """
 
-import time
+import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlSafeLoader
+
 
 class ConfigCache:
-    """配置缓存类，基于文件修改时间实现缓存失效机制。"""
+    """配置缓存类，基于文件修改时间和大小实现缓存失效机制（LRU淘汰）。"""
 
-    def __init__(self):
-        self._cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(self, max_entries: int = 16):
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._signatures: Dict[str, Tuple[int, int]] = {}
         self._timestamps: Dict[str, float] = {}
+        self._max_entries = max_entries
+
+    @staticmethod
+    def _signature(stat: os.stat_result) -> Tuple[int, int]:
+        return stat.st_mtime_ns, stat.st_size
+
+    def _forget(self, path_str: str) -> None:
+        self._cache.pop(path_str, None)
+        self._signatures.pop(path_str, None)
+        self._timestamps.pop(path_str, None)
 
     def get(self, config_path: Path) -> Optional[Dict[str, Any]]:
         """
@@ -34,38 +51,51 @@ class ConfigCache:
             return None
 
         # 检查文件是否被修改
-        if not config_path.exists():
+        try:
+            stat = config_path.stat()
+        except OSError:
             # 文件不存在，清除缓存
-            self._cache.pop(path_str, None)
-            self._timestamps.pop(path_str, None)
+            self._forget(path_str)
             return None
 
-        current_mtime = config_path.stat().st_mtime
-        cached_mtime = self._timestamps.get(path_str, 0)
-
-        if current_mtime > cached_mtime:
-            # 文件已被修改，缓存失效
-            self._cache.pop(path_str, None)
-            self._timestamps.pop(path_str, None)
+        if self._signature(stat) != self._signatures.get(path_str):
+            # 文件已被修改（mtime或大小变化），缓存失效
+            self._forget(path_str)
             return None
 
+        self._cache.move_to_end(path_str)
         return self._cache[path_str]
 
-    def set(self, config_path: Path, data: Dict[str, Any]) -> None:
+    def set(
+        self,
+        config_path: Path,
+        data: Dict[str, Any],
+        stat: Optional[os.stat_result] = None,
+    ) -> None:
         """
         设置配置缓存。
 
         Args:
             config_path: 配置文件路径
             data: 配置数据
+            stat: 读取文件前获取的stat结果；读取期间文件若被修改，缓存会在下次get时失效
         """
         path_str = str(config_path)
 
-        if not config_path.exists():
-            return
+        if stat is None:
+            try:
+                stat = config_path.stat()
+            except OSError:
+                return
 
         self._cache[path_str] = data
-        self._timestamps[path_str] = config_path.stat().st_mtime
+        self._cache.move_to_end(path_str)
+        self._signatures[path_str] = self._signature(stat)
+        self._timestamps[path_str] = stat.st_mtime
+        while len(self._cache) > self._max_entries:
+            evicted, _ = self._cache.popitem(last=False)
+            self._signatures.pop(evicted, None)
+            self._timestamps.pop(evicted, None)
 
     def clear(self, config_path: Optional[Path] = None) -> None:
         """
@@ -76,11 +106,10 @@ class ConfigCache:
         """
         if config_path is None:
             self._cache.clear()
+            self._signatures.clear()
             self._timestamps.clear()
         else:
-            path_str = str(config_path)
-            self._cache.pop(path_str, None)
-            self._timestamps.pop(path_str, None)
+            self._forget(str(config_path))
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -115,19 +144,21 @@ def load_yaml_with_cache(config_path: Path) -> Dict[str, Any]:
     if cached_data is not None:
         return cached_data
 
-    # 缓存未命中，加载文件
-    if not config_path.exists():
+    # 缓存未命中，加载文件；先stat再读取，避免把旧内容记在新签名下
+    try:
+        stat = config_path.stat()
+    except OSError:
         return {}
 
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=YamlSafeLoader) or {}
 
         if not isinstance(data, dict):
             return {}
 
         # 存入缓存
-        _config_cache.set(config_path, data)
+        _config_cache.set(config_path, data, stat)
         return data
     except Exception:
         return {}
@@ -12,8 +12,12 @@ from pathlib import Path
 from threading import Lock
 from typing import Any, Dict, List, Optional
 
+from core.event_sourcing import decode_event_line
 from core.paths import DATA_DIR
 
+# 增量索引校验已索引区间时比对的首尾字节数
+_FINGERPRINT_BYTES = 4096
+
 
 class EventLogCache:
     """事件日志缓存器
@@ -35,6 +39,23 @@ class EventLogCache:
         self._last_size: int = 0
         self._lock = Lock()
         self._logger = logging.getLogger(__name__)
+        self._reset_latest_index()
+
+    def _reset_latest_index(self) -> None:
+        self._latest_by_type: Dict[str, Dict[str, Any]] = {}
+        self._latest_offset: int = 0
+        self._latest_inode: Optional[int] = None
+        self._latest_mtime_ns: Optional[int] = None
+        self._latest_fingerprint: bytes = b""
+
+    @staticmethod
+    def _indexed_fingerprint(f, offset: int) -> bytes:
+        """读取已索引区间[0, offset)的首尾字节，用于识别日志被重写。"""
+        span = min(offset, _FINGERPRINT_BYTES)
+        f.seek(0)
+        head = f.read(span)
+        f.seek(offset - span)
+        return head + f.read(span)
 
     def _should_reload(self) -> bool:
         """
@@ -232,12 +253,68 @@ class EventLogCache:
         cutoff_date = datetime.now() - timedelta(days=days)
         return self.get_events_since(cutoff_date, force_reload)
 
+    def get_latest_by_type(self) -> Dict[str, Dict[str, Any]]:
+        """
+        获取每种事件类型的最新事件。
+
+        追加写入时只扫描上次提交的字节偏移之后的内容；文件被替换（inode变化）、
+        变小、同大小但mtime变化，或已索引区间的首尾字节不再一致（例如迁移或归档
+        重写后又追加了事件）时，完整重建索引。
+
+        Returns:
+            事件类型到最新事件的映射（浅拷贝，事件对象不可修改）
+        """
+        with self._lock:
+            try:
+                stat = self.log_path.stat()
+            except OSError:
+                self._reset_latest_index()
+                return {}
+
+            offset = self._latest_offset
+            if (
+                stat.st_ino != self._latest_inode
+                or stat.st_size < offset
+                or (stat.st_size == offset and stat.st_mtime_ns != self._latest_mtime_ns)
+            ):
+                self._reset_latest_index()
+                offset = 0
+            elif stat.st_size == offset:
+                return dict(self._latest_by_type)
+
+            with open(self.log_path, "rb") as f:
+                if offset and self._indexed_fingerprint(f, offset) != self._latest_fingerprint:
+                    self._reset_latest_index()
+                    offset = 0
+                by_type = self._latest_by_type
+                f.seek(offset)
+                for raw in f:
+                    # 末尾没有换行的行可能仍在写入：先索引，但偏移停在它之前，下次重读
+                    if raw.endswith(b"\n"):
+                        offset += len(raw)
+                    line = raw.strip()
+                    if not line:
+                        continue
+                    try:
+                        event = decode_event_line(line)
+                    except ValueError:
+                        continue
+                    if event.get("type"):
+                        by_type[event["type"]] = event
+                self._latest_fingerprint = self._indexed_fingerprint(f, offset)
+
+            self._latest_offset = offset
+            self._latest_inode = stat.st_ino
+            self._latest_mtime_ns = stat.st_mtime_ns
+            return dict(by_type)
+
     def clear_cache(self) -> None:
         """清空缓存"""
         with self._lock:
             self._cache.clear()
             self._last_mtime = None
             self._last_size = 0
+            self._reset_latest_index()
             self._logger.info("事件日志缓存已清空")
 
     def get_cache_stats(self) -> Dict[str, Any]:
@@ -257,8 +334,8 @@ class EventLogCache:
             }
 
 
-# 全局事件日志缓存实例
-_event_log_cache: Optional[EventLogCache] = None
+# 全局事件日志缓存实例（按日志路径区分）
+_event_log_caches: Dict[Path, EventLogCache] = {}
 _cache_lock = Lock()
 
 
@@ -267,18 +344,19 @@ def get_event_log_cache(log_path: Optional[Path] = None) -> EventLogCache:
     获取事件日志缓存单例实例。
 
     Args:
-        log_path: 事件日志文件路径
+        log_path: 事件日志文件路径，默认为data/event_log.jsonl
 
     Returns:
-        EventLogCache实例
+        该路径对应的EventLogCache实例
     """
-    global _event_log_cache
+    path = Path(log_path) if log_path is not None else DATA_DIR / "event_log.jsonl"
 
     with _cache_lock:
-        if _event_log_cache is None:
-            _event_log_cache = EventLogCache(log_path)
+        cache = _event_log_caches.get(path)
+        if cache is None:
+            cache = _event_log_caches[path] = EventLogCache(path)
 
-        return _event_log_cache
+        return cache
 
 
 def load_events(days: int = 7, force_reload: bool = False) -> List[Dict[str, Any]]:
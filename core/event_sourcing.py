@@ -10,7 +10,7 @@ import json
 import logging
 from datetime import datetime, date
 from uuid import uuid4
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Union
 
 # Core Data Models
 from core.models import UserProfile, Goal, Task, Execution, GoalStatus, TaskStatus
@@ -25,6 +25,24 @@ logger = logging.getLogger("event_sourcing")
 EVENT_SCHEMA_VERSION = "1.0"
 REQUIRED_EVENT_FIELDS = ("type", "timestamp", "schema_version", "event_id")
 
+
+def encode_event_line(event: Dict[str, Any]) -> bytes:
+    """Serialize an event as one UTF-8 JSONL line, trailing newline included."""
+    return (json.dumps(event, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def decode_event_line(line: Union[bytes, str]) -> Dict[str, Any]:
+    """
+    Parse one JSONL line (str or bytes) into an event dict.
+
+    Raises ValueError for lines that are not a JSON object; json.JSONDecodeError and
+    UnicodeDecodeError are ValueError subclasses, so one except clause covers all cases.
+    """
+    event = json.loads(line)
+    if not isinstance(event, dict):
+        raise ValueError(f"event line is not a JSON object: {type(event).__name__}")
+    return event
+
 # --- Initial State Structure ---
 
 def get_initial_state() -> Dict[str, Any]:
@@ -264,7 +282,7 @@ def rebuild_state() -> Dict[str, Any]:
                 if not line.strip():
                     continue
                 try:
-                    event = json.loads(line)
+                    event = decode_event_line(line)
                     state = apply_event(state, event)
                 except Exception as e:
                     logger.error(f"Failed to process event: {line[:100]}... Error: {e}")
@@ -289,13 +307,14 @@ def validate_event_shape(event: Dict[str, Any], strict: bool = False) -> Dict[st
     return {"valid": not missing, "missing": missing}
 
 
-def normalize_event(event: Dict[str, Any]) -> Dict[str, Any]:
+def normalize_event(event: Dict[str, Any], timestamp: Optional[str] = None) -> Dict[str, Any]:
     """
     Normalize an event to the canonical shape.
+    A missing timestamp is filled from `timestamp` when given, else from the current time.
     """
     normalized = dict(event)
     if not normalized.get("timestamp"):
-        normalized["timestamp"] = datetime.now().isoformat()
+        normalized["timestamp"] = timestamp or datetime.now().isoformat()
     if not normalized.get("schema_version"):
         normalized["schema_version"] = EVENT_SCHEMA_VERSION
     if not normalized.get("event_id"):
@@ -308,19 +327,36 @@ def append_event(event: Dict[str, Any]) -> None:
     Append an event to the event log.
     After append: time_tick -> create_snapshot(force=True); else -> create_snapshot() if interval.
     """
-    normalized_event = normalize_event(event)
-    shape = validate_event_shape(normalized_event, strict=True)
-    if not shape["valid"]:
-        missing = ", ".join(shape["missing"])
-        raise ValueError(f"Event missing required fields: {missing}")
+    append_events([event])
+
+
+def append_events(events: List[Dict[str, Any]]) -> None:
+    """
+    Append several events to the event log with a single write.
+
+    All events are validated before anything is written, so a bad event leaves the log
+    untouched. Events without a timestamp share one batch timestamp, and the snapshot
+    check runs once for the whole batch.
+    """
+    batch_timestamp = datetime.now().isoformat()
+    normalized_events = []
+    for event in events:
+        normalized_event = normalize_event(event, timestamp=batch_timestamp)
+        shape = validate_event_shape(normalized_event, strict=True)
+        if not shape["valid"]:
+            missing = ", ".join(shape["missing"])
+            raise ValueError(f"Event missing required fields: {missing}")
+        normalized_events.append(normalized_event)
+    if not normalized_events:
+        return
 
     EVENT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(EVENT_LOG_PATH, "a", encoding="utf-8") as f:
-        f.write(json.dumps(normalized_event, ensure_ascii=False, default=str) + "\n")
+    with open(EVENT_LOG_PATH, "ab") as f:
+        f.write(b"".join(encode_event_line(event) for event in normalized_events))
 
     from core.snapshot_manager import create_snapshot, should_create_snapshot
-    if normalized_event.get("type") == "time_tick":
+    if any(normalized_event.get("type") == "time_tick" for normalized_event in normalized_events):
         create_snapshot(force=True)
     elif should_create_snapshot():
         create_snapshot()
@@ -7,6 +7,7 @@ import re
 import uuid
 from dataclasses import asdict
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from core.blueprint import Blueprint
@@ -19,6 +20,42 @@ from core.objective_engine.models import GoalLayer, GoalSource, GoalState, Objec
 from core.objective_engine.registry import GoalRegistry, get_registry
 from core.task_decomposer import TaskDecomposer
 
+_OPTION_TITLE_PREFIX = re.compile(
+    r"^(?:Option|选项)\s*[0-9a-zA-Z一二三四五六七八九十IVXLCDM]+[:：\s\-\.]*",
+    re.IGNORECASE,
+)
+
+_LAYER_BY_NAME: Dict[str, GoalLayer] = {
+    "vision": GoalLayer.VISION,
+    "objective": GoalLayer.OBJECTIVE,
+    "goal": GoalLayer.GOAL,
+}
+
+_STATE_BY_NAME: Dict[str, GoalState] = {
+    "draft": GoalState.DRAFT,
+    "active": GoalState.ACTIVE,
+    "vision_pending_confirmation": GoalState.VISION_PENDING_CONFIRMATION,
+    "completed": GoalState.COMPLETED,
+    "archived": GoalState.ARCHIVED,
+    "blocked": GoalState.BLOCKED,
+    "pending_confirm": GoalState.VISION_PENDING_CONFIRMATION,
+    "abandoned": GoalState.ARCHIVED,
+}
+
+_ANCHOR_TOKEN = re.compile(r"[a-z0-9\u4e00-\u9fff]{2,}")
+
+
+@lru_cache(maxsize=64)
+def _anchor_item_terms(items: Tuple[str, ...]) -> Tuple[Tuple[str, str, Tuple[str, ...]], ...]:
+    # Anchor items are scored against every node on create/update and on each
+    # recompute pass; normalize and tokenize them once per distinct anchor tuple.
+    terms = []
+    for item in items:
+        normalized_item = GoalService._normalize_anchor_text(item)
+        if normalized_item:
+            terms.append((item, normalized_item, tuple(_ANCHOR_TOKEN.findall(normalized_item))))
+    return tuple(terms)
+
 
 class GoalService:
     """Application service for canonical goal operations."""
@@ -62,12 +99,7 @@ class GoalService:
 
     @staticmethod
     def layer_from_string(layer: Optional[str]) -> GoalLayer:
-        mapping = {
-            "vision": GoalLayer.VISION,
-            "objective": GoalLayer.OBJECTIVE,
-            "goal": GoalLayer.GOAL,
-        }
-        return mapping.get((layer or "goal").lower(), GoalLayer.GOAL)
+        return _LAYER_BY_NAME.get((layer or "goal").lower(), GoalLayer.GOAL)
 
     @staticmethod
     def decomposition_horizon_from_layer(layer: GoalLayer) -> str:
@@ -81,17 +113,7 @@ class GoalService:
     @staticmethod
     def state_from_string(state: Optional[str]) -> GoalState:
         raw = str(state or "").strip().lower()
-        mapping = {
-            "draft": GoalState.DRAFT,
-            "active": GoalState.ACTIVE,
-            "vision_pending_confirmation": GoalState.VISION_PENDING_CONFIRMATION,
-            "completed": GoalState.COMPLETED,
-            "archived": GoalState.ARCHIVED,
-            "blocked": GoalState.BLOCKED,
-            "pending_confirm": GoalState.VISION_PENDING_CONFIRMATION,
-            "abandoned": GoalState.ARCHIVED,
-        }
-        return mapping.get(raw, GoalState.ACTIVE)
+        return _STATE_BY_NAME.get(raw, GoalState.ACTIVE)
 
     @staticmethod
     def next_layer(layer: GoalLayer) -> GoalLayer:
@@ -117,15 +139,11 @@ class GoalService:
 
     def _anchor_item_matches(self, text: str, items: Tuple[str, ...]) -> List[str]:
         matches: List[str] = []
-        for item in items:
-            normalized_item = self._normalize_anchor_text(item)
-            if not normalized_item:
-                continue
+        for item, normalized_item, tokens in _anchor_item_terms(items):
             if normalized_item in text:
                 matches.append(item)
                 continue
             # Fallback token matching for long phrases.
-            tokens = re.findall(r"[a-z0-9\u4e00-\u9fff]{2,}", normalized_item)
             if tokens and any(token in text for token in tokens):
                 matches.append(item)
         return matches
@@ -710,8 +728,7 @@ class GoalService:
 
     @staticmethod
     def normalize_title(title: str) -> str:
-        pattern = r"^(?:Option|选项)\s*[0-9a-zA-Z一二三四五六七八九十IVXLCDM]+[:：\s\-\.]*"
-        return re.sub(pattern, "", str(title or ""), flags=re.IGNORECASE).strip()
+        return _OPTION_TITLE_PREFIX.sub("", str(title or ""), count=1).strip()
 
     def _decompose_to_tasks(self, goal: DecompositionGoal) -> int:
         decomposer = TaskDecomposer()
@@ -91,10 +91,17 @@ def __source_from_str(s: str):
 class GoalRegistry:
     """In-memory registry with JSON persistence at REGISTRY_PATH."""
 
-    def __init__(self, path: Optional[Path] = None):
+    def __init__(self, path: Optional[Path] = None, *, persist: bool = True):
         self._path = path if path is not None else REGISTRY_PATH
+        self._persist = persist
         self._nodes: dict[str, ObjectiveNode] = {}
-        self._load()
+        if persist:
+            self._load()
+
+    @classmethod
+    def in_memory(cls) -> "GoalRegistry":
+        """Registry that neither loads nor saves JSON; for tests and scratch computations."""
+        return cls(persist=False)
 
     def _load(self) -> None:
         if not self._path.exists():
@@ -112,6 +119,8 @@ class GoalRegistry:
             pass
 
     def save(self) -> None:
+        if not self._persist:
+            return
         self._path.parent.mkdir(parents=True, exist_ok=True)
         payload = {"nodes": [_node_to_dict(n) for n in self._nodes.values()]}
         with open(self._path, "w", encoding="utf-8") as f:
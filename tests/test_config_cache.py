@@ -0,0 +1,25 @@
+from core.config_cache import ConfigCache
+
+
+def test_entry_stored_under_pre_read_stat_is_invalidated_by_concurrent_write(tmp_path):
+    config_path = tmp_path / "blueprint.yaml"
+    config_path.write_text("mode: shadow\n", encoding="utf-8")
+    cache = ConfigCache()
+
+    stat_before_read = config_path.stat()
+    config_path.write_text("mode: assist_with_review\n", encoding="utf-8")
+    cache.set(config_path, {"mode": "shadow"}, stat_before_read)
+
+    assert cache.get(config_path) is None
+
+
+def test_get_stats_reports_float_mtimes(tmp_path):
+    config_path = tmp_path / "blueprint.yaml"
+    config_path.write_text("mode: shadow\n", encoding="utf-8")
+    cache = ConfigCache()
+    cache.set(config_path, {"mode": "shadow"})
+
+    stats = cache.get_stats()
+
+    assert cache.get(config_path) == {"mode": "shadow"}
+    assert stats["timestamps"] == {str(config_path): config_path.stat().st_mtime}
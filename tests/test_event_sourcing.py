@@ -1,14 +1,24 @@
 """
 Tests for Event Sourcing Core (current data model).
 """
+import json
 import shutil
 import unittest
+from datetime import datetime
 from pathlib import Path
 from tempfile import mkdtemp
 
 import core.event_sourcing as es
-from core.event_sourcing import apply_event, append_event, get_initial_state, rebuild_state
-from core.models import GoalStatus, TaskStatus
+from core.event_sourcing import (
+    apply_event,
+    append_event,
+    append_events,
+    decode_event_line,
+    encode_event_line,
+    get_initial_state,
+    rebuild_state,
+)
+from core.models import GoalStatus, TaskStatus, UserProfile
 
 
 class TestEventSourcing(unittest.TestCase):
@@ -62,6 +72,91 @@ class TestEventSourcing(unittest.TestCase):
         with open(es.EVENT_LOG_PATH, "r", encoding="utf-8") as f:
             self.assertEqual(len([l for l in f if l.strip()]), 2)
 
+    def test_append_events_writes_batch_in_order(self):
+        append_events(
+            [
+                {
+                    "type": "profile_updated",
+                    "payload": {"field": "occupation", "value": "designer"},
+                    "timestamp": "2026-01-01T10:00:00",
+                },
+                {
+                    "type": "profile_updated",
+                    "payload": {"field": "occupation", "value": "engineer"},
+                    "timestamp": "2026-01-01T10:05:00",
+                },
+            ]
+        )
+
+        state = rebuild_state()
+        self.assertEqual(state["profile"].occupation, "engineer")
+        with open(es.EVENT_LOG_PATH, "r", encoding="utf-8") as f:
+            self.assertEqual(len([line for line in f if line.strip()]), 2)
+
+    def test_append_events_rejects_whole_batch_on_invalid_event(self):
+        with self.assertRaises(ValueError):
+            append_events(
+                [
+                    {"type": "profile_updated", "timestamp": "2026-01-01T10:00:00"},
+                    {"payload": {"missing": "type"}},
+                ]
+            )
+        self.assertFalse(es.EVENT_LOG_PATH.exists())
+
+    def test_append_events_stamps_batch_with_one_timestamp(self):
+        append_events(
+            [
+                {"type": "profile_updated", "payload": {"field": "occupation", "value": "a"}},
+                {"type": "profile_updated", "payload": {"field": "occupation", "value": "b"}},
+                {
+                    "type": "profile_updated",
+                    "payload": {"field": "occupation", "value": "c"},
+                    "timestamp": "2026-01-01T10:00:00",
+                },
+            ]
+        )
+
+        with open(es.EVENT_LOG_PATH, "r", encoding="utf-8") as f:
+            timestamps = [json.loads(line)["timestamp"] for line in f if line.strip()]
+        self.assertEqual(timestamps[0], timestamps[1])
+        self.assertEqual(timestamps[2], "2026-01-01T10:00:00")
+
+    def test_event_line_round_trip_keeps_unicode_and_stringifies_datetimes(self):
+        line = encode_event_line(
+            {"type": "note", "payload": {"text": "专注", "at": datetime(2026, 1, 1, 9, 30)}}
+        )
+
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertIn("专注".encode("utf-8"), line)
+        event = decode_event_line(line)
+        self.assertEqual(event["payload"]["at"], "2026-01-01 09:30:00")
+
+    def test_event_line_matches_stdlib_json_for_enum_nan_and_dataclass_payloads(self):
+        event = {
+            "type": "note",
+            "payload": {
+                "status": GoalStatus.ACTIVE,
+                "score": float("nan"),
+                "profile": UserProfile(occupation="dev"),
+                "big": 2**70,
+            },
+        }
+
+        line = encode_event_line(event)
+
+        expected = json.dumps(event, ensure_ascii=False, default=str) + "\n"
+        self.assertEqual(line, expected.encode("utf-8"))
+        payload = decode_event_line(line)["payload"]
+        self.assertEqual(payload["status"], "active")
+        self.assertNotEqual(payload["score"], payload["score"])
+        self.assertEqual(payload["profile"], str(UserProfile(occupation="dev")))
+        self.assertEqual(payload["big"], 2**70)
+
+    def test_decode_event_line_rejects_non_object_lines(self):
+        for line in (b"[1, 2]", "null", b'"text"', b"{broken"):
+            with self.subTest(line=line), self.assertRaises(ValueError):
+                decode_event_line(line)
+
     def test_apply_event_time_tick(self):
         state = get_initial_state()
         new_state = apply_event(
@@ -1,8 +1,14 @@
 import asyncio
+import copy
 import json
+import os
+from dataclasses import dataclass
 from datetime import datetime
-from types import SimpleNamespace
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
 import yaml
+from fastapi import HTTPException
 
 import core.event_sourcing as event_sourcing
 import core.snapshot_manager as snapshot_manager
@@ -12,29 +18,89 @@ from core.objective_engine.models import GoalLayer, GoalSource, GoalState, Objec
 from core.objective_engine.registry import GoalRegistry
 from core.steward import Steward
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
-def test_layer_mapping():
-    assert GoalService.layer_from_string("vision") == GoalLayer.VISION
-    assert GoalService.layer_from_string("objective") == GoalLayer.OBJECTIVE
-    assert GoalService.layer_from_string("goal") == GoalLayer.GOAL
-    assert GoalService.decomposition_horizon_from_layer(GoalLayer.VISION) == "vision"
-    assert GoalService.decomposition_horizon_from_layer(GoalLayer.OBJECTIVE) == "milestone"
-    assert GoalService.decomposition_horizon_from_layer(GoalLayer.GOAL) == "goal"
 
+def load_yaml(text):
+    return yaml.load(text, Loader=_YAML_LOADER)
+
+
+def dump_yaml(data):
+    return yaml.dump(data, Dumper=_YAML_DUMPER, sort_keys=False, allow_unicode=True)
+
+
+# One loop for the whole module instead of a fresh loop per asyncio.run call.
+_LOOP = asyncio.new_event_loop()
+
+
+def _run(coro):
+    return _LOOP.run_until_complete(coro)
 
-def test_status_mapping():
-    assert (
-        GoalService.state_from_string("vision_pending_confirmation")
-        == GoalState.VISION_PENDING_CONFIRMATION
-    )
-    assert GoalService.state_from_string("active") == GoalState.ACTIVE
-    assert GoalService.state_from_string("completed") == GoalState.COMPLETED
-    assert GoalService.state_from_string("archived") == GoalState.ARCHIVED
-    assert GoalService.state_from_string("pending_confirm") == GoalState.VISION_PENDING_CONFIRMATION
+
+# For handlers that never await: step the coroutine once, no loop involved.
+def _run_sync(coro):
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("handler suspended; use _run() for handlers that await")
+
+
+def teardown_module(module):
+    _LOOP.close()
 
 
-def test_node_to_dict_is_canonical(tmp_path):
-    registry = GoalRegistry(path=tmp_path / "goal_registry.json")
+_FIXED_NOW = datetime(2026, 2, 12, 12, 0, 0)
+
+
+_AUTO_EVALUATE_NOOP = MappingProxyType(
+    {
+        "status": "noop",
+        "mode": "shadow",
+        "reason": "assist_mode_required",
+        "evaluated_count": 0,
+        "targets": [],
+    }
+)
+
+
+def _resolved(result):
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(dict(result))
+    return future
+
+
+@pytest.mark.parametrize(
+    "name, layer, horizon",
+    [
+        ("vision", GoalLayer.VISION, "vision"),
+        ("objective", GoalLayer.OBJECTIVE, "milestone"),
+        ("goal", GoalLayer.GOAL, "goal"),
+    ],
+)
+def test_layer_mapping(name, layer, horizon):
+    assert GoalService.layer_from_string(name) is layer
+    assert GoalService.decomposition_horizon_from_layer(layer) == horizon
+
+
+@pytest.mark.parametrize(
+    "name, state",
+    [
+        ("vision_pending_confirmation", GoalState.VISION_PENDING_CONFIRMATION),
+        ("active", GoalState.ACTIVE),
+        ("completed", GoalState.COMPLETED),
+        ("archived", GoalState.ARCHIVED),
+        ("pending_confirm", GoalState.VISION_PENDING_CONFIRMATION),
+    ],
+)
+def test_status_mapping(name, state):
+    assert GoalService.state_from_string(name) is state
+
+
+def test_node_to_dict_is_canonical():
+    registry = GoalRegistry.in_memory()
     service = GoalService(registry=registry)
     node = ObjectiveNode(
         id="g_1",
@@ -59,21 +125,39 @@ def test_normalize_title():
     assert GoalService.normalize_title("Plain Title") == "Plain Title"
 
 
-def test_goal_service_applies_anchor_alignment_when_creating_node(tmp_path):
-    registry = GoalRegistry(path=tmp_path / "goal_registry.json")
-    service = GoalService(registry=registry)
+@pytest.fixture
+def emitted_events(monkeypatch):
+    events = []
+    monkeypatch.setattr(api_router, "append_event", events.append)
+    return events
 
-    class DummyAnchor:
-        version = "v9"
-        long_horizon_commitments = ("Write deeply", "Ship meaningful products")
-        anti_values = ("doomscroll",)
 
-    class DummyAnchorManager:
-        @staticmethod
-        def get_current():
-            return DummyAnchor()
+@pytest.fixture
+def router_doubles(monkeypatch, emitted_events):
+    snapshots = []
+    monkeypatch.setattr(
+        api_router, "build_guardian_retrospective_response", lambda days=7: snapshots.pop(0)
+    )
+    return SimpleNamespace(emitted=emitted_events, snapshots=snapshots)
+
+
+@pytest.fixture
+def anchor_manager():
+    manager = SimpleNamespace(
+        anchor=SimpleNamespace(
+            version="v1",
+            long_horizon_commitments=("Write deeply", "Ship meaningful products"),
+            anti_values=("doomscroll",),
+        )
+    )
+    manager.get_current = lambda: manager.anchor
+    return manager
+
 
-    service.anchor_manager = DummyAnchorManager()
+def test_goal_service_applies_anchor_alignment_when_creating_node(anchor_manager):
+    registry = GoalRegistry.in_memory()
+    service = GoalService(registry=registry)
+    service.anchor_manager = anchor_manager
 
     node = service.create_node(
         title="Write deeply every morning",
@@ -82,37 +166,30 @@ def test_goal_service_applies_anchor_alignment_when_creating_node(tmp_path):
         state=GoalState.ACTIVE,
     )
 
-    assert node.anchor_version == "v9"
+    assert node.anchor_version == "v1"
     assert node.alignment_level in {"high", "medium", "low"}
     assert node.alignment_score is not None
     assert "Write deeply" in node.matched_commitments
     assert "doomscroll" in node.matched_anti_values
 
 
-def test_recompute_active_alignment_updates_nodes(tmp_path, monkeypatch):
-    monkeypatch.setattr("core.goal_service.append_event", lambda event: None)
-    registry = GoalRegistry(path=tmp_path / "goal_registry.json")
-    service = GoalService(registry=registry)
-
-    class AnchorV1:
-        version = "v1"
-        long_horizon_commitments = ("Write deeply",)
-        anti_values = ("doomscroll",)
-
-    class AnchorV2:
-        version = "v2"
-        long_horizon_commitments = ("Ship weekly",)
-        anti_values = ("doomscroll",)
+def test_anchor_item_matches_falls_back_to_phrase_tokens():
+    service = GoalService(registry=SimpleNamespace())
+    items = ("Ship meaningful products", "  ", "深度写作 每天")
+    text = service._normalize_anchor_text("Keep products small; 每天 review")
 
-    class DummyAnchorManager:
-        def __init__(self):
-            self.anchor = AnchorV1()
+    assert service._anchor_item_matches(text, items) == [
+        "Ship meaningful products",
+        "深度写作 每天",
+    ]
+    assert service._anchor_item_matches("nothing relevant", items) == []
 
-        def get_current(self):
-            return self.anchor
 
-    dummy_manager = DummyAnchorManager()
-    service.anchor_manager = dummy_manager
+def test_recompute_active_alignment_updates_nodes(monkeypatch, anchor_manager):
+    monkeypatch.setattr("core.goal_service.append_event", lambda event: None)
+    registry = GoalRegistry.in_memory()
+    service = GoalService(registry=registry)
+    service.anchor_manager = anchor_manager
 
     node = service.create_node(
         title="Write deeply every morning",
@@ -122,7 +199,11 @@ def test_recompute_active_alignment_updates_nodes(tmp_path, monkeypatch):
     )
     assert node.anchor_version == "v1"
 
-    dummy_manager.anchor = AnchorV2()
+    anchor_manager.anchor = SimpleNamespace(
+        version="v2",
+        long_horizon_commitments=("Ship weekly",),
+        anti_values=("doomscroll",),
+    )
     result = service.recompute_active_alignment(detail_limit=10)
     refreshed = service.require_node(node.id)
 
@@ -140,14 +221,51 @@ def test_append_event_injects_canonical_metadata(tmp_path, monkeypatch):
 
     event_sourcing.append_event({"type": "unit_test_event", "payload": {"value": 1}})
 
-    raw = log_path.read_text(encoding="utf-8").strip()
-    saved = json.loads(raw)
+    saved = event_sourcing.decode_event_line(log_path.read_bytes())
     assert saved["type"] == "unit_test_event"
     assert saved["schema_version"] == event_sourcing.EVENT_SCHEMA_VERSION
     assert saved["event_id"].startswith("evt_")
     assert "timestamp" in saved
 
 
+def _nested_get(payload, dotted_key):
+    value = payload
+    for key in dotted_key.split("."):
+        value = value[key]
+    return value
+
+
+_EXPECTED_STATE_AUDIT_FIELDS = frozenset(
+    {
+        "retrospective.humanization_metrics",
+        "retrospective.north_star_metrics",
+        "retrospective.intervention_policy",
+        "retrospective.blueprint_narrative",
+        "guardian.boundaries",
+    }
+)
+
+_DECISION_REASON_KEYS = ("constraint", "risk", "trigger")
+
+_EXPECTED_STATE_METRICS = {
+    "l2_protection_rate": 0.6,
+    "l2_protection_thresholds.high": 0.75,
+    "recovery_adoption_rate": 0.5,
+    "friction_load.score": 0.67,
+    "support_vs_override.mode": "balanced",
+    "policy_version": "guardian_policy_v1_evidence_loop",
+    "policy_evidence.active_signal_count": 0,
+    "perceived_control_score.score": 0.48,
+    "interruption_burden_rate.rate": 0.5,
+    "recovery_time_to_resume_minutes.status": "unavailable",
+    "mundane_time_saved_hours.hours": 0.25,
+    "north_star.window_days": 7,
+    "mundane_automation_coverage": 0.55,
+    "human_trust_index": 0.7,
+    "alignment_delta_weekly": 4.0,
+}
+
+
 def test_state_endpoint_includes_stable_audit_shape(monkeypatch):
     class DummyGoalService:
         @staticmethod
@@ -175,102 +293,99 @@ def test_state_endpoint_includes_stable_audit_shape(monkeypatch):
         def get_current_phase():
             return "deep_work"
 
-    monkeypatch.setattr(api_router, "get_steward", lambda: DummySteward())
-    monkeypatch.setattr(api_router, "get_goal_service", lambda: DummyGoalService())
-    monkeypatch.setattr(api_router, "_has_review_due_this_week", lambda: False)
-    monkeypatch.setattr(
-        api_router,
-        "build_guardian_retrospective_response",
-        lambda days=7: {
-            "intervention_level": "ASK",
-            "require_confirm": True,
-            "l2_protection": {
-                "ratio": 0.6,
-                "level": "medium",
-                "summary": "L2 保护一般",
-                "trend": [],
-                "thresholds": {"high": 0.75, "medium": 0.5},
-            },
-            "humanization_metrics": {
-                "recovery_adoption_rate": {"rate": 0.5},
-                "friction_load": {"score": 0.67, "level": "high"},
-                "support_vs_override": {"support_ratio": 0.4, "mode": "balanced"},
-                "trust_calibration": {
-                    "perceived_control_score": {"status": "ready", "score": 0.48},
-                    "interruption_burden_rate": {"status": "ready", "rate": 0.5},
-                    "recovery_time_to_resume_minutes": {
-                        "status": "unavailable",
-                        "reason": "no_l2_interrupt_resume_pair",
-                    },
-                    "mundane_time_saved_hours": {"status": "ready", "hours": 0.25},
+    retrospective = {
+        "intervention_level": "ASK",
+        "require_confirm": True,
+        "l2_protection": {
+            "ratio": 0.6,
+            "level": "medium",
+            "summary": "L2 保护一般",
+            "trend": [],
+            "thresholds": {"high": 0.75, "medium": 0.5},
+        },
+        "humanization_metrics": {
+            "recovery_adoption_rate": {"rate": 0.5},
+            "friction_load": {"score": 0.67, "level": "high"},
+            "support_vs_override": {"support_ratio": 0.4, "mode": "balanced"},
+            "trust_calibration": {
+                "perceived_control_score": {"status": "ready", "score": 0.48},
+                "interruption_burden_rate": {"status": "ready", "rate": 0.5},
+                "recovery_time_to_resume_minutes": {
+                    "status": "unavailable",
+                    "reason": "no_l2_interrupt_resume_pair",
                 },
+                "mundane_time_saved_hours": {"status": "ready", "hours": 0.25},
             },
-            "intervention_policy": {
-                "mode": "balanced_intervention",
-                "reason": "Medium-severity deviation is active, so Guardian uses balanced cadence.",
-                "policy_version": "guardian_policy_v1_evidence_loop",
-                "evidence": {
-                    "window_days": 7,
-                    "active_signal_count": 0,
-                    "active_signals": [],
-                    "response_events": {
-                        "total": 0,
-                        "action_counts": {"confirm": 0, "snooze": 0, "dismiss": 0, "unknown": 0},
-                        "context_counts": {
-                            "recovering": 0,
-                            "resource_blocked": 0,
-                            "task_too_big": 0,
-                            "instinct_escape": 0,
-                            "unknown": 0,
-                        },
-                    },
-                    "trust_repair": {
-                        "active": False,
-                        "reason": "",
-                        "negative_streak": 0,
-                        "negative_streak_threshold": 2,
-                        "recent_signal_count": 0,
-                        "last_negative_at": None,
-                        "streak_sources": [],
+        },
+        "intervention_policy": {
+            "mode": "balanced_intervention",
+            "reason": "Medium-severity deviation is active, so Guardian uses balanced cadence.",
+            "policy_version": "guardian_policy_v1_evidence_loop",
+            "evidence": {
+                "window_days": 7,
+                "active_signal_count": 0,
+                "active_signals": [],
+                "response_events": {
+                    "total": 0,
+                    "action_counts": {"confirm": 0, "snooze": 0, "dismiss": 0, "unknown": 0},
+                    "context_counts": {
+                        "recovering": 0,
+                        "resource_blocked": 0,
+                        "task_too_big": 0,
+                        "instinct_escape": 0,
+                        "unknown": 0,
                     },
                 },
-                "friction_budget": {"suppressed": False},
-            },
-            "north_star_metrics": {
-                "window_days": 7,
-                "mundane_automation_coverage": {"rate": 0.55, "met_target": True},
-                "l2_bloom_hours": {"hours": 3.0, "met_target": True},
-                "human_trust_index": {"score": 0.7, "met_target": True},
-                "alignment_delta_weekly": {"delta": 4.0, "met_target": True},
-                "targets_met": {"met_count": 4, "total": 4},
-            },
-            "explainability": {
-                "why_this_suggestion": "Suggestion is triggered by: repeated_skip 2/2.",
-                "what_happens_next": (
-                    "ASK mode is active: confirm this suggestion or respond with context."
-                ),
-            },
-            "confirmation_action": {
-                "required": True,
-                "confirmed": False,
-                "confirmed_at": None,
-                "endpoint": "/api/v1/retrospective/confirm",
-                "method": "POST",
-                "fingerprint": "gcf_dummy",
+                "trust_repair": {
+                    "active": False,
+                    "reason": "",
+                    "negative_streak": 0,
+                    "negative_streak_threshold": 2,
+                    "recent_signal_count": 0,
+                    "last_negative_at": None,
+                    "streak_sources": [],
+                },
             },
+            "friction_budget": {"suppressed": False},
         },
-    )
+        "north_star_metrics": {
+            "window_days": 7,
+            "mundane_automation_coverage": {"rate": 0.55, "met_target": True},
+            "l2_bloom_hours": {"hours": 3.0, "met_target": True},
+            "human_trust_index": {"score": 0.7, "met_target": True},
+            "alignment_delta_weekly": {"delta": 4.0, "met_target": True},
+            "targets_met": {"met_count": 4, "total": 4},
+        },
+        "explainability": {
+            "why_this_suggestion": "Suggestion is triggered by: repeated_skip 2/2.",
+            "what_happens_next": (
+                "ASK mode is active: confirm this suggestion or respond with context."
+            ),
+        },
+        "confirmation_action": {
+            "required": True,
+            "confirmed": False,
+            "confirmed_at": None,
+            "endpoint": "/api/v1/retrospective/confirm",
+            "method": "POST",
+            "fingerprint": "gcf_dummy",
+        },
+    }
 
-    payload = asyncio.run(api_router.get_state())
+    monkeypatch.setattr(api_router, "get_steward", lambda: DummySteward())
+    monkeypatch.setattr(api_router, "get_goal_service", lambda: DummyGoalService())
+    monkeypatch.setattr(api_router, "_has_review_due_this_week", lambda: False)
+    monkeypatch.setattr(
+        api_router,
+        "build_guardian_retrospective_response",
+        lambda days=7: retrospective,
+    )
+    payload = _run_sync(api_router.get_state())
     assert "audit" in payload
     assert payload["audit"]["strategy"] == "state_projection"
     assert isinstance(payload["audit"]["used_state_fields"], list)
-    assert "retrospective.humanization_metrics" in payload["audit"]["used_state_fields"]
-    assert "retrospective.north_star_metrics" in payload["audit"]["used_state_fields"]
-    assert "retrospective.intervention_policy" in payload["audit"]["used_state_fields"]
-    assert "retrospective.blueprint_narrative" in payload["audit"]["used_state_fields"]
-    assert "guardian.boundaries" in payload["audit"]["used_state_fields"]
-    assert set(payload["audit"]["decision_reason"]) == {"trigger", "constraint", "risk"}
+    assert _EXPECTED_STATE_AUDIT_FIELDS <= frozenset(payload["audit"]["used_state_fields"])
+    assert tuple(sorted(payload["audit"]["decision_reason"])) == _DECISION_REASON_KEYS
     assert payload["guardian"]["intervention_level"] == "ASK"
     assert payload["guardian"]["pending_confirmation"] is True
     assert payload["guardian"]["confirmation_action"]["endpoint"] == "/api/v1/retrospective/confirm"
@@ -280,26 +395,12 @@ def test_state_endpoint_includes_stable_audit_shape(monkeypatch):
     assert payload["guardian"]["explainability"]["why_this_suggestion"].startswith(
         "Suggestion is triggered by:"
     )
-    assert payload["guardian"]["metrics"]["l2_protection_rate"] == 0.6
-    assert payload["guardian"]["metrics"]["l2_protection_thresholds"]["high"] == 0.75
-    assert payload["guardian"]["metrics"]["recovery_adoption_rate"] == 0.5
-    assert payload["guardian"]["metrics"]["friction_load"]["score"] == 0.67
-    assert payload["guardian"]["metrics"]["support_vs_override"]["mode"] == "balanced"
     assert payload["guardian"]["policy_version"] == "guardian_policy_v1_evidence_loop"
     assert payload["guardian"]["policy_evidence"]["window_days"] == 7
-    assert payload["guardian"]["metrics"]["policy_version"] == "guardian_policy_v1_evidence_loop"
-    assert payload["guardian"]["metrics"]["policy_evidence"]["active_signal_count"] == 0
-    assert payload["guardian"]["metrics"]["perceived_control_score"]["score"] == 0.48
-    assert payload["guardian"]["metrics"]["interruption_burden_rate"]["rate"] == 0.5
-    assert (
-        payload["guardian"]["metrics"]["recovery_time_to_resume_minutes"]["status"]
-        == "unavailable"
-    )
-    assert payload["guardian"]["metrics"]["mundane_time_saved_hours"]["hours"] == 0.25
-    assert payload["guardian"]["metrics"]["north_star"]["window_days"] == 7
-    assert payload["guardian"]["metrics"]["mundane_automation_coverage"] == 0.55
-    assert payload["guardian"]["metrics"]["human_trust_index"] == 0.7
-    assert payload["guardian"]["metrics"]["alignment_delta_weekly"] == 4.0
+    metrics = payload["guardian"]["metrics"]
+    assert {
+        key: _nested_get(metrics, key) for key in _EXPECTED_STATE_METRICS
+    } == _EXPECTED_STATE_METRICS
     assert "boundaries" in payload["guardian"]
     assert isinstance(payload["guardian"]["boundaries"], dict)
     assert "alignment" in payload
@@ -307,60 +408,95 @@ def test_state_endpoint_includes_stable_audit_shape(monkeypatch):
     assert payload["meta"]["event_schema_version"] == event_sourcing.EVENT_SCHEMA_VERSION
 
 
-def test_get_guardian_config_defaults_when_file_missing(monkeypatch, tmp_path):
+_GUARDIAN_CONFIG_DEFAULTS = [
+    (
+        api_router.get_guardian_config,
+        {
+            "intervention_level": "SOFT",
+            "thresholds.deviation_signals.repeated_skip": 2,
+            "thresholds.l2_protection.high": 0.75,
+            "authority.escalation.window_days": 7,
+            "authority.safe_mode.enabled": True,
+        },
+    ),
+    (
+        api_router.get_guardian_autotune_config,
+        {
+            "enabled": False,
+            "mode": "shadow",
+            "llm_enabled": True,
+            "trigger.lookback_days": 7,
+            "guardrails.max_int_step": 1,
+            "auto_evaluate.enabled": True,
+            "auto_evaluate.horizon_hours": 48,
+            "auto_evaluate.lookback_days": 90,
+            "auto_evaluate.max_targets_per_cycle": 3,
+        },
+    ),
+    (
+        api_router.get_guardian_boundaries_config,
+        {
+            "reminder_frequency": "balanced",
+            "reminder_channel": "in_app",
+            "quiet_hours.enabled": True,
+            "quiet_hours.start_hour": 22,
+            "quiet_hours.end_hour": 8,
+            "quiet_hours.timezone": "local",
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "endpoint, expected", _GUARDIAN_CONFIG_DEFAULTS, ids=["guardian", "autotune", "boundaries"]
+)
+def test_get_guardian_config_endpoints_default_when_file_missing(
+    monkeypatch, tmp_path, endpoint, expected
+):
     missing_path = tmp_path / "blueprint.yaml"
     monkeypatch.setattr(api_router, "BLUEPRINT_CONFIG_PATH", missing_path)
 
-    payload = asyncio.run(api_router.get_guardian_config())
-    config = payload["config"]
+    config = _run(endpoint())["config"]
 
-    assert config["intervention_level"] == "SOFT"
-    assert config["thresholds"]["deviation_signals"]["repeated_skip"] == 2
-    assert config["thresholds"]["l2_protection"]["high"] == 0.75
-    assert config["authority"]["escalation"]["window_days"] == 7
-    assert config["authority"]["safe_mode"]["enabled"] is True
+    for key, value in expected.items():
+        assert _nested_get(config, key) == value, key
 
 
-def test_get_guardian_autotune_config_defaults_when_file_missing(monkeypatch, tmp_path):
-    missing_path = tmp_path / "blueprint.yaml"
-    monkeypatch.setattr(api_router, "BLUEPRINT_CONFIG_PATH", missing_path)
+def test_load_blueprint_yaml_returns_copy_and_reloads_on_change(monkeypatch, tmp_path):
+    config_path = tmp_path / "blueprint.yaml"
+    config_path.write_text("intervention_level: SOFT\n", encoding="utf-8")
+    monkeypatch.setattr(api_router, "BLUEPRINT_CONFIG_PATH", config_path)
 
-    payload = asyncio.run(api_router.get_guardian_autotune_config())
-    config = payload["config"]
+    first = api_router._load_blueprint_yaml()
+    first["intervention_level"] = "MUTATED"
+    first["guardian_thresholds"] = {"deviation_signals": {}}
+    assert api_router._load_blueprint_yaml() == {"intervention_level": "SOFT"}
 
-    assert config["enabled"] is False
-    assert config["mode"] == "shadow"
-    assert config["llm_enabled"] is True
-    assert config["trigger"]["lookback_days"] == 7
-    assert config["guardrails"]["max_int_step"] == 1
-    assert config["auto_evaluate"]["enabled"] is True
-    assert config["auto_evaluate"]["horizon_hours"] == 48
-    assert config["auto_evaluate"]["lookback_days"] == 90
-    assert config["auto_evaluate"]["max_targets_per_cycle"] == 3
+    config_path.write_text("intervention_level: ASK\nextra: 1\n", encoding="utf-8")
+    assert api_router._load_blueprint_yaml() == {"intervention_level": "ASK", "extra": 1}
 
 
-def test_get_guardian_boundaries_config_defaults_when_file_missing(monkeypatch, tmp_path):
-    missing_path = tmp_path / "blueprint.yaml"
-    monkeypatch.setattr(api_router, "BLUEPRINT_CONFIG_PATH", missing_path)
+def test_write_blueprint_yaml_keeps_previous_file_when_dump_fails(monkeypatch, tmp_path):
+    config_path = tmp_path / "blueprint.yaml"
+    config_path.write_text("intervention_level: SOFT\n", encoding="utf-8")
+    monkeypatch.setattr(api_router, "BLUEPRINT_CONFIG_PATH", config_path)
 
-    payload = asyncio.run(api_router.get_guardian_boundaries_config())
-    config = payload["config"]
+    with pytest.raises(yaml.YAMLError):
+        api_router._write_blueprint_yaml({"intervention_level": object()})
+    assert config_path.read_text(encoding="utf-8") == "intervention_level: SOFT\n"
 
-    assert config["reminder_frequency"] == "balanced"
-    assert config["reminder_channel"] == "in_app"
-    assert config["quiet_hours"]["enabled"] is True
-    assert config["quiet_hours"]["start_hour"] == 22
-    assert config["quiet_hours"]["end_hour"] == 8
-    assert config["quiet_hours"]["timezone"] == "local"
+    api_router._write_blueprint_yaml({"intervention_level": "ASK"})
+    assert api_router._load_blueprint_yaml() == {"intervention_level": "ASK"}
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["blueprint.yaml"]
 
 
-def test_update_guardian_boundaries_config_persists_and_emits_event(monkeypatch, tmp_path):
+def test_update_guardian_boundaries_config_persists_and_emits_event(
+    monkeypatch, tmp_path, emitted_events
+):
     config_path = tmp_path / "blueprint.yaml"
     config_path.write_text("intervention_level: SOFT\n", encoding="utf-8")
-    emitted = []
 
     monkeypatch.setattr(api_router, "BLUEPRINT_CONFIG_PATH", config_path)
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
 
     req = api_router.GuardianBoundariesConfigUpdateRequest(
         reminder_frequency="low",
@@ -373,14 +509,14 @@ def test_update_guardian_boundaries_config_persists_and_emits_event(monkeypatch,
         ),
     )
 
-    payload = asyncio.run(api_router.update_guardian_boundaries_config(req))
+    payload = _run(api_router.update_guardian_boundaries_config(req))
     assert payload["status"] == "updated"
     assert payload["config"]["reminder_frequency"] == "low"
     assert payload["config"]["reminder_channel"] == "digest"
     assert payload["config"]["quiet_hours"]["start_hour"] == 21
-    assert emitted and emitted[0]["type"] == "guardian_boundaries_config_updated"
+    assert emitted_events and emitted_events[0]["type"] == "guardian_boundaries_config_updated"
 
-    saved = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    saved = load_yaml(config_path.read_text(encoding="utf-8"))
     assert saved["guardian_boundaries"]["reminder_frequency"] == "low"
     assert saved["guardian_boundaries"]["reminder_channel"] == "digest"
     assert saved["guardian_boundaries"]["quiet_hours"]["end_hour"] == 9
@@ -391,21 +527,18 @@ def test_update_guardian_boundaries_config_rejects_invalid_frequency():
         reminder_frequency="extreme",
         reminder_channel="in_app",
     )
-    try:
-        asyncio.run(api_router.update_guardian_boundaries_config(req))
-    except Exception as exc:
-        assert getattr(exc, "status_code", None) == 400
-    else:
-        assert False, "Expected 400 when reminder_frequency is invalid"
+    with pytest.raises(HTTPException) as excinfo:
+        _run(api_router.update_guardian_boundaries_config(req))
+    assert excinfo.value.status_code == 400
 
 
-def test_update_guardian_autotune_config_persists_and_emits_event(monkeypatch, tmp_path):
+def test_update_guardian_autotune_config_persists_and_emits_event(
+    monkeypatch, tmp_path, emitted_events
+):
     config_path = tmp_path / "blueprint.yaml"
     config_path.write_text("intervention_level: SOFT\n", encoding="utf-8")
-    emitted = []
 
     monkeypatch.setattr(api_router, "BLUEPRINT_CONFIG_PATH", config_path)
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
 
     req = api_router.GuardianAutoTuneConfigUpdateRequest(
         enabled=True,
@@ -429,16 +562,16 @@ def test_update_guardian_autotune_config_persists_and_emits_event(monkeypatch, t
         ),
     )
 
-    payload = asyncio.run(api_router.update_guardian_autotune_config(req))
+    payload = _run(api_router.update_guardian_autotune_config(req))
     assert payload["status"] == "updated"
     assert payload["config"]["enabled"] is True
     assert payload["config"]["llm_enabled"] is False
     assert payload["config"]["trigger"]["cooldown_hours"] == 36
     assert payload["config"]["auto_evaluate"]["horizon_hours"] == 72
     assert payload["config"]["auto_evaluate"]["max_targets_per_cycle"] == 5
-    assert emitted and emitted[0]["type"] == "guardian_autotune_config_updated"
+    assert emitted_events and emitted_events[0]["type"] == "guardian_autotune_config_updated"
 
-    saved = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    saved = load_yaml(config_path.read_text(encoding="utf-8"))
     assert saved["guardian_autotune"]["enabled"] is True
     assert saved["guardian_autotune"]["trigger"]["min_event_count"] == 12
     assert saved["guardian_autotune"]["auto_evaluate"]["lookback_days"] == 120
@@ -455,21 +588,19 @@ def test_update_guardian_autotune_config_accepts_assist_mode(monkeypatch, tmp_pa
         mode="assist",
         llm_enabled=True,
     )
-    payload = asyncio.run(api_router.update_guardian_autotune_config(req))
+    payload = _run(api_router.update_guardian_autotune_config(req))
     assert payload["status"] == "updated"
     assert payload["config"]["mode"] == "assist"
 
-    saved = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    saved = load_yaml(config_path.read_text(encoding="utf-8"))
     assert saved["guardian_autotune"]["mode"] == "assist"
 
 
-def test_update_guardian_config_persists_and_emits_event(monkeypatch, tmp_path):
+def test_update_guardian_config_persists_and_emits_event(monkeypatch, tmp_path, emitted_events):
     config_path = tmp_path / "blueprint.yaml"
     config_path.write_text("intervention_level: SOFT\n", encoding="utf-8")
-    emitted = []
 
     monkeypatch.setattr(api_router, "BLUEPRINT_CONFIG_PATH", config_path)
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
 
     req = api_router.GuardianConfigUpdateRequest(
         intervention_level="ASK",
@@ -496,16 +627,16 @@ def test_update_guardian_config_persists_and_emits_event(monkeypatch, tmp_path):
         ),
     )
 
-    payload = asyncio.run(api_router.update_guardian_config(req))
+    payload = _run(api_router.update_guardian_config(req))
 
     assert payload["status"] == "updated"
     assert payload["config"]["intervention_level"] == "ASK"
     assert payload["config"]["thresholds"]["deviation_signals"]["repeated_skip"] == 4
     assert payload["config"]["thresholds"]["l2_protection"]["high"] == 0.8
     assert payload["config"]["authority"]["escalation"]["window_days"] == 9
-    assert emitted and emitted[0]["type"] == "guardian_config_updated"
+    assert emitted_events and emitted_events[0]["type"] == "guardian_config_updated"
 
-    saved = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    saved = load_yaml(config_path.read_text(encoding="utf-8"))
     assert saved["intervention_level"] == "ASK"
     assert saved["guardian_thresholds"]["deviation_signals"]["stagnation_days"] == 5
     assert saved["guardian_authority"]["safe_mode"]["cooldown_hours"] == 36
@@ -522,41 +653,31 @@ def test_update_guardian_config_rejects_invalid_l2_thresholds():
         l2_protection=api_router.GuardianL2ThresholdsRequest(high=0.5, medium=0.7),
     )
 
-    try:
-        asyncio.run(api_router.update_guardian_config(req))
-    except Exception as exc:
-        assert getattr(exc, "status_code", None) == 400
-    else:
-        assert False, "Expected 400 when l2_protection.medium > l2_protection.high"
+    with pytest.raises(HTTPException) as excinfo:
+        _run(api_router.update_guardian_config(req))
+    assert excinfo.value.status_code == 400
+
+
+_CUSTOM_AUTHORITY_BLUEPRINT_YAML = """\
+intervention_level: SOFT
+guardian_authority:
+  escalation:
+    window_days: 11
+    firm_reminder_resistance: 2
+    periodic_check_resistance: 6
+  safe_mode:
+    enabled: true
+    resistance_threshold: 7
+    min_response_events: 4
+    max_confirmation_ratio: 0.25
+    recovery_confirmations: 2
+    cooldown_hours: 48
+"""
 
 
 def test_update_guardian_config_preserves_authority_when_not_provided(monkeypatch, tmp_path):
     config_path = tmp_path / "blueprint.yaml"
-    config_path.write_text(
-        yaml.safe_dump(
-            {
-                "intervention_level": "SOFT",
-                "guardian_authority": {
-                    "escalation": {
-                        "window_days": 11,
-                        "firm_reminder_resistance": 2,
-                        "periodic_check_resistance": 6,
-                    },
-                    "safe_mode": {
-                        "enabled": True,
-                        "resistance_threshold": 7,
-                        "min_response_events": 4,
-                        "max_confirmation_ratio": 0.25,
-                        "recovery_confirmations": 2,
-                        "cooldown_hours": 48,
-                    },
-                },
-            },
-            sort_keys=False,
-            allow_unicode=True,
-        ),
-        encoding="utf-8",
-    )
+    config_path.write_text(_CUSTOM_AUTHORITY_BLUEPRINT_YAML, encoding="utf-8")
     monkeypatch.setattr(api_router, "BLUEPRINT_CONFIG_PATH", config_path)
     monkeypatch.setattr(api_router, "append_event", lambda event: None)
 
@@ -569,42 +690,38 @@ def test_update_guardian_config_preserves_authority_when_not_provided(monkeypatc
         ),
         l2_protection=api_router.GuardianL2ThresholdsRequest(high=0.8, medium=0.6),
     )
-    payload = asyncio.run(api_router.update_guardian_config(req))
+    payload = _run(api_router.update_guardian_config(req))
 
     assert payload["config"]["authority"]["escalation"]["window_days"] == 11
     assert payload["config"]["authority"]["safe_mode"]["resistance_threshold"] == 7
 
 
-def test_sys_cycle_normalizes_audit_shape(monkeypatch):
-    class DummySteward:
-        @staticmethod
-        def run_planning_cycle():
-            return {"actions": [], "executed_auto_tasks": [], "audit": {"strategy": "custom"}}
+class _CustomAuditSteward:
+    @staticmethod
+    def run_planning_cycle():
+        return {"actions": [], "executed_auto_tasks": [], "audit": {"strategy": "custom"}}
 
-    monkeypatch.setattr(api_router, "get_steward", lambda: DummySteward())
+
+def test_sys_cycle_normalizes_audit_shape(monkeypatch):
+    monkeypatch.setattr(api_router, "get_steward", lambda: _CustomAuditSteward())
     monkeypatch.setattr(
         api_router,
         "_run_guardian_autotune_shadow",
         lambda trigger="cycle": {"status": "disabled", "mode": "shadow"},
     )
-    async def fake_auto_evaluate(trigger="cycle"):
-        return {
-            "status": "noop",
-            "mode": "shadow",
-            "reason": "assist_mode_required",
-            "evaluated_count": 0,
-            "targets": [],
-        }
-
-    monkeypatch.setattr(api_router, "_run_guardian_autotune_auto_evaluate", fake_auto_evaluate)
+    monkeypatch.setattr(
+        api_router,
+        "_run_guardian_autotune_auto_evaluate",
+        lambda trigger="cycle": _resolved(_AUTO_EVALUATE_NOOP),
+    )
     monkeypatch.setattr(api_router, "append_event", lambda event: None)
 
-    payload = asyncio.run(api_router.trigger_cycle())
+    payload = _run(api_router.trigger_cycle())
     assert payload["status"] == "cycled"
     assert payload["guardian_autotune"]["status"] == "disabled"
     assert payload["audit"]["strategy"] == "custom"
     assert isinstance(payload["audit"]["used_state_fields"], list)
-    assert set(payload["audit"]["decision_reason"]) == {"trigger", "constraint", "risk"}
+    assert tuple(sorted(payload["audit"]["decision_reason"])) == _DECISION_REASON_KEYS
 
 
 def test_sys_cycle_preserves_anchor_audit_extension(monkeypatch):
@@ -631,33 +748,21 @@ def test_sys_cycle_preserves_anchor_audit_extension(monkeypatch):
         "_run_guardian_autotune_shadow",
         lambda trigger="cycle": {"status": "disabled", "mode": "shadow"},
     )
-    async def fake_auto_evaluate(trigger="cycle"):
-        return {
-            "status": "noop",
-            "mode": "shadow",
-            "reason": "assist_mode_required",
-            "evaluated_count": 0,
-            "targets": [],
-        }
-
-    monkeypatch.setattr(api_router, "_run_guardian_autotune_auto_evaluate", fake_auto_evaluate)
+    monkeypatch.setattr(
+        api_router,
+        "_run_guardian_autotune_auto_evaluate",
+        lambda trigger="cycle": _resolved(_AUTO_EVALUATE_NOOP),
+    )
     monkeypatch.setattr(api_router, "append_event", lambda event: None)
-    payload = asyncio.run(api_router.trigger_cycle())
+    payload = _run(api_router.trigger_cycle())
 
     assert "anchor" in payload["audit"]
     assert payload["audit"]["anchor"]["enabled"] is True
     assert payload["audit"]["anchor"]["blocked_actions"] == 1
 
 
-def test_sys_cycle_includes_autotune_auto_evaluation(monkeypatch):
-    emitted = []
-
-    class DummySteward:
-        @staticmethod
-        def run_planning_cycle():
-            return {"actions": [], "executed_auto_tasks": [], "audit": {"strategy": "custom"}}
-
-    monkeypatch.setattr(api_router, "get_steward", lambda: DummySteward())
+def test_sys_cycle_includes_autotune_auto_evaluation(monkeypatch, emitted_events):
+    monkeypatch.setattr(api_router, "get_steward", lambda: _CustomAuditSteward())
     monkeypatch.setattr(
         api_router,
         "_run_guardian_autotune_shadow",
@@ -675,58 +780,59 @@ def test_sys_cycle_includes_autotune_auto_evaluation(monkeypatch):
         }
 
     monkeypatch.setattr(api_router, "_run_guardian_autotune_auto_evaluate", fake_auto_eval)
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
 
-    payload = asyncio.run(api_router.trigger_cycle())
+    payload = _run(api_router.trigger_cycle())
     assert payload["guardian_autotune_evaluation"]["status"] == "completed"
     assert payload["guardian_autotune_evaluation"]["evaluated_count"] == 1
-    assert emitted and emitted[0]["type"] == api_router.AUTOTUNE_EVENT_AUTO_EVALUATE_CYCLE
+    assert emitted_events
+    assert emitted_events[0]["type"] == api_router.AUTOTUNE_EVENT_AUTO_EVALUATE_CYCLE
 
 
-def test_pending_autotune_evaluation_targets_filters_by_due_and_evaluated(monkeypatch):
-    class FixedDatetime(datetime):
-        @classmethod
-        def now(cls, tz=None):
-            return cls(2026, 2, 12, 12, 0, 0)
-
-    events = [
+# Read-only event templates; the router checks isinstance(..., dict) on events and
+# payloads, so tests hand out shallow dict copies.
+_PENDING_TARGET_EVENTS = (
+    MappingProxyType(
         {
             "type": api_router.AUTOTUNE_EVENT_APPLIED,
             "timestamp": "2026-02-12T08:00:00",
             "payload": {"proposal_id": "atp_recent", "fingerprint": "gatfp_recent"},
-        },
+        }
+    ),
+    MappingProxyType(
         {
             "type": api_router.AUTOTUNE_EVENT_APPLIED,
             "timestamp": "2026-02-09T08:00:00",
             "payload": {"proposal_id": "atp_due_done", "fingerprint": "gatfp_due_done"},
-        },
+        }
+    ),
+    MappingProxyType(
         {
             "type": api_router.AUTOTUNE_EVENT_APPLIED,
             "timestamp": "2026-02-08T08:00:00",
             "payload": {"proposal_id": "atp_due_pending", "fingerprint": "gatfp_due_pending"},
-        },
-    ]
+        }
+    ),
+    MappingProxyType(
+        {
+            "type": api_router.AUTOTUNE_EVENT_EVALUATED,
+            "timestamp": "2026-02-11T09:00:00",
+            "payload": {
+                "proposal_id": "atp_due_done",
+                "fingerprint": "gatfp_due_done",
+                "applied_at": "2026-02-09T08:00:00",
+            },
+        }
+    ),
+)
 
-    def fake_latest_autotune_event(event_type, proposal_id=None, fingerprint=None):
-        if (
-            event_type == api_router.AUTOTUNE_EVENT_EVALUATED
-            and proposal_id == "atp_due_done"
-            and fingerprint == "gatfp_due_done"
-        ):
-            return {
-                "type": event_type,
-                "timestamp": "2026-02-11T09:00:00",
-                "payload": {
-                    "proposal_id": proposal_id,
-                    "fingerprint": fingerprint,
-                    "applied_at": "2026-02-09T08:00:00",
-                },
-            }
-        return None
 
-    monkeypatch.setattr(api_router, "datetime", FixedDatetime)
-    monkeypatch.setattr(api_router, "_load_events_for_days", lambda days: events)
-    monkeypatch.setattr(api_router, "_load_latest_autotune_event", fake_latest_autotune_event)
+def test_pending_autotune_evaluation_targets_filters_by_due_and_evaluated(monkeypatch):
+    monkeypatch.setattr(api_router, "_now", lambda: _FIXED_NOW)
+    monkeypatch.setattr(
+        api_router,
+        "_load_events_for_days",
+        lambda days: [dict(event) for event in _PENDING_TARGET_EVENTS],
+    )
 
     targets = api_router._pending_autotune_evaluation_targets(
         horizon_hours=48,
@@ -738,37 +844,55 @@ def test_pending_autotune_evaluation_targets_filters_by_due_and_evaluated(monkey
     assert targets[0]["fingerprint"] == "gatfp_due_pending"
 
 
-def test_run_guardian_autotune_shadow_proposes_patch(monkeypatch):
-    emitted = []
-    monkeypatch.setattr(
-        api_router,
-        "_load_blueprint_yaml",
-        lambda: {
-            "intervention_level": "SOFT",
-            "guardian_thresholds": {
-                "deviation_signals": {
-                    "repeated_skip": 2,
-                    "l2_interruption": 1,
-                    "stagnation_days": 3,
-                },
-                "l2_protection": {"high": 0.75, "medium": 0.50},
+# Retrospective that makes the deterministic tuner propose a patch; read-only, so
+# the patched builders return shallow copies like the event templates above.
+_HIGH_FRICTION_RETROSPECTIVE = MappingProxyType(
+    {
+        "humanization_metrics": {
+            "friction_load": {"score": 0.82, "level": "high"},
+            "recovery_adoption_rate": {"rate": 0.25},
+            "support_vs_override": {"support_ratio": 0.2},
+        },
+        "l2_protection": {"ratio": 0.3, "level": "low"},
+        "deviation_signals": [],
+    }
+)
+
+
+def _shadow_autotune_blueprint(mode):
+    return {
+        "intervention_level": "SOFT",
+        "guardian_thresholds": {
+            "deviation_signals": {
+                "repeated_skip": 2,
+                "l2_interruption": 1,
+                "stagnation_days": 3,
             },
-            "guardian_autotune": {
-                "enabled": True,
-                "mode": "shadow",
-                "llm_enabled": False,
-                "trigger": {
-                    "lookback_days": 7,
-                    "min_event_count": 1,
-                    "cooldown_hours": 24,
-                },
-                "guardrails": {
-                    "max_int_step": 1,
-                    "max_float_step": 0.05,
-                    "min_confidence": 0.55,
-                },
+            "l2_protection": {"high": 0.75, "medium": 0.50},
+        },
+        "guardian_autotune": {
+            "enabled": True,
+            "mode": mode,
+            "llm_enabled": False,
+            "trigger": {
+                "lookback_days": 7,
+                "min_event_count": 1,
+                "cooldown_hours": 24,
+            },
+            "guardrails": {
+                "max_int_step": 1,
+                "max_float_step": 0.05,
+                "min_confidence": 0.55,
             },
         },
+    }
+
+
+def test_run_guardian_autotune_shadow_proposes_patch(monkeypatch, router_doubles):
+    monkeypatch.setattr(
+        api_router,
+        "_load_blueprint_yaml",
+        lambda: _shadow_autotune_blueprint("shadow"),
     )
     monkeypatch.setattr(
         api_router,
@@ -776,22 +900,9 @@ def test_run_guardian_autotune_shadow_proposes_patch(monkeypatch):
         lambda days: [{"type": "task_updated", "timestamp": "2026-02-11T10:00:00"}],
     )
     monkeypatch.setattr(api_router, "_load_latest_event", lambda event_type: None)
-    monkeypatch.setattr(
-        api_router,
-        "build_guardian_retrospective_response",
-        lambda days=7: {
-            "humanization_metrics": {
-                "friction_load": {"score": 0.82, "level": "high"},
-                "recovery_adoption_rate": {"rate": 0.25},
-                "support_vs_override": {"support_ratio": 0.2},
-            },
-            "l2_protection": {"ratio": 0.3, "level": "low"},
-            "deviation_signals": [],
-        },
-    )
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
+    router_doubles.snapshots.append(dict(_HIGH_FRICTION_RETROSPECTIVE))
 
-    payload = asyncio.run(
+    payload = _run(
         api_router.run_guardian_autotune_shadow(
             api_router.GuardianAutoTuneRunRequest(trigger="manual")
         )
@@ -799,30 +910,15 @@ def test_run_guardian_autotune_shadow_proposes_patch(monkeypatch):
     assert payload["status"] == "proposed"
     assert payload["mode"] == "shadow"
     assert "repeated_skip" in payload["proposal"]["patch"]
-    assert emitted and emitted[0]["type"] == "guardian_autotune_shadow_proposed"
+    assert router_doubles.emitted
+    assert router_doubles.emitted[0]["type"] == "guardian_autotune_shadow_proposed"
 
 
 def test_run_guardian_autotune_shadow_respects_cooldown(monkeypatch):
     monkeypatch.setattr(
         api_router,
         "_load_blueprint_yaml",
-        lambda: {
-            "guardian_autotune": {
-                "enabled": True,
-                "mode": "shadow",
-                "llm_enabled": False,
-                "trigger": {
-                    "lookback_days": 7,
-                    "min_event_count": 1,
-                    "cooldown_hours": 24,
-                },
-                "guardrails": {
-                    "max_int_step": 1,
-                    "max_float_step": 0.05,
-                    "min_confidence": 0.55,
-                },
-            }
-        },
+        lambda: _shadow_autotune_blueprint("shadow"),
     )
     monkeypatch.setattr(
         api_router,
@@ -830,7 +926,7 @@ def test_run_guardian_autotune_shadow_respects_cooldown(monkeypatch):
         lambda event_type: {"type": event_type, "timestamp": datetime.now().isoformat()},
     )
 
-    payload = asyncio.run(
+    payload = _run(
         api_router.run_guardian_autotune_shadow(
             api_router.GuardianAutoTuneRunRequest(trigger="manual")
         )
@@ -839,37 +935,11 @@ def test_run_guardian_autotune_shadow_respects_cooldown(monkeypatch):
     assert payload["reason"] == "cooldown_active"
 
 
-def test_run_guardian_autotune_shadow_supports_assist_mode(monkeypatch):
-    emitted = []
+def test_run_guardian_autotune_shadow_supports_assist_mode(monkeypatch, router_doubles):
     monkeypatch.setattr(
         api_router,
         "_load_blueprint_yaml",
-        lambda: {
-            "intervention_level": "SOFT",
-            "guardian_thresholds": {
-                "deviation_signals": {
-                    "repeated_skip": 2,
-                    "l2_interruption": 1,
-                    "stagnation_days": 3,
-                },
-                "l2_protection": {"high": 0.75, "medium": 0.50},
-            },
-            "guardian_autotune": {
-                "enabled": True,
-                "mode": "assist",
-                "llm_enabled": False,
-                "trigger": {
-                    "lookback_days": 7,
-                    "min_event_count": 1,
-                    "cooldown_hours": 24,
-                },
-                "guardrails": {
-                    "max_int_step": 1,
-                    "max_float_step": 0.05,
-                    "min_confidence": 0.55,
-                },
-            },
-        },
+        lambda: _shadow_autotune_blueprint("assist"),
     )
     monkeypatch.setattr(
         api_router,
@@ -877,29 +947,17 @@ def test_run_guardian_autotune_shadow_supports_assist_mode(monkeypatch):
         lambda days: [{"type": "task_updated", "timestamp": "2026-02-11T10:00:00"}],
     )
     monkeypatch.setattr(api_router, "_load_latest_event", lambda event_type: None)
-    monkeypatch.setattr(
-        api_router,
-        "build_guardian_retrospective_response",
-        lambda days=7: {
-            "humanization_metrics": {
-                "friction_load": {"score": 0.82, "level": "high"},
-                "recovery_adoption_rate": {"rate": 0.25},
-                "support_vs_override": {"support_ratio": 0.2},
-            },
-            "l2_protection": {"ratio": 0.3, "level": "low"},
-            "deviation_signals": [],
-        },
-    )
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
+    router_doubles.snapshots.append(dict(_HIGH_FRICTION_RETROSPECTIVE))
 
-    payload = asyncio.run(
+    payload = _run(
         api_router.run_guardian_autotune_shadow(
             api_router.GuardianAutoTuneRunRequest(trigger="manual")
         )
     )
     assert payload["status"] == "proposed"
     assert payload["mode"] == "assist"
-    assert emitted and emitted[0]["type"] == api_router.AUTOTUNE_EVENT_PROPOSED
+    assert router_doubles.emitted
+    assert router_doubles.emitted[0]["type"] == api_router.AUTOTUNE_EVENT_PROPOSED
 
 
 def test_get_guardian_autotune_lifecycle_latest_includes_identity(monkeypatch):
@@ -926,15 +984,14 @@ def test_get_guardian_autotune_lifecycle_latest_includes_identity(monkeypatch):
 
     monkeypatch.setattr(api_router, "_load_latest_event", fake_load_latest)
 
-    payload = asyncio.run(api_router.get_guardian_autotune_lifecycle_latest())
+    payload = _run(api_router.get_guardian_autotune_lifecycle_latest())
     proposal = payload["proposal"]
     assert proposal["proposal_id"].startswith("atp_")
     assert proposal["fingerprint"].startswith("gatfp_")
     assert proposal["lifecycle_status"] == "proposed"
 
 
-def test_review_guardian_autotune_lifecycle_appends_review_event(monkeypatch):
-    emitted = []
+def test_review_guardian_autotune_lifecycle_appends_review_event(monkeypatch, emitted_events):
     proposal_payload = {
         "proposal_id": "atp_test_1",
         "fingerprint": "gatfp_test_1",
@@ -959,7 +1016,6 @@ def test_review_guardian_autotune_lifecycle_appends_review_event(monkeypatch):
         return None
 
     monkeypatch.setattr(api_router, "_load_latest_event", fake_load_latest)
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
     monkeypatch.setattr(api_router, "_current_autotune_mode", lambda: "assist")
 
     req = api_router.GuardianAutoTuneLifecycleActionRequest(
@@ -969,62 +1025,75 @@ def test_review_guardian_autotune_lifecycle_appends_review_event(monkeypatch):
         source="manual",
         reason="proposal looks safe",
     )
-    payload = asyncio.run(api_router.review_guardian_autotune_lifecycle(req))
+    payload = _run(api_router.review_guardian_autotune_lifecycle(req))
 
     assert payload["status"] == "reviewed"
     assert payload["mode"] == "assist"
-    assert emitted and emitted[0]["type"] == api_router.AUTOTUNE_EVENT_REVIEWED
-    assert emitted[0]["payload"]["proposal_id"] == "atp_test_1"
-    assert emitted[0]["payload"]["actor"] == "tester"
+    assert emitted_events and emitted_events[0]["type"] == api_router.AUTOTUNE_EVENT_REVIEWED
+    assert emitted_events[0]["payload"]["proposal_id"] == "atp_test_1"
+    assert emitted_events[0]["payload"]["actor"] == "tester"
 
 
-def test_apply_guardian_autotune_lifecycle_persists_thresholds(monkeypatch, tmp_path):
-    config_path = tmp_path / "blueprint.yaml"
-    config_path.write_text(
-        yaml.safe_dump(
-            {
-                "intervention_level": "SOFT",
-                "guardian_thresholds": {
-                    "deviation_signals": {
-                        "repeated_skip": 2,
-                        "l2_interruption": 1,
-                        "stagnation_days": 3,
-                    },
-                    "l2_protection": {"high": 0.75, "medium": 0.50},
-                },
-                "guardian_authority": {
-                    "escalation": {
-                        "window_days": 7,
-                        "firm_reminder_resistance": 2,
-                        "periodic_check_resistance": 4,
-                    },
-                    "safe_mode": {
-                        "enabled": True,
-                        "resistance_threshold": 5,
-                        "min_response_events": 3,
-                        "max_confirmation_ratio": 0.34,
-                        "recovery_confirmations": 2,
-                        "cooldown_hours": 24,
-                    },
-                },
-            },
-            sort_keys=False,
-            allow_unicode=True,
-        ),
-        encoding="utf-8",
+def test_autotune_event_identity_derives_stable_legacy_fingerprint():
+    # Events written before fingerprints were stored are matched by re-deriving them,
+    # so the derivation must not drift between releases.
+    payload = {"patch": {"repeated_skip": {"from": 2, "to": 3}}}
+
+    identity = api_router._autotune_event_identity(
+        payload, fallback_timestamp="2026-02-12T09:10:00"
     )
 
-    emitted = []
-    proposal_payload = {
-        "proposal_id": "atp_test_2",
-        "fingerprint": "gatfp_test_2",
-        "patch": {"repeated_skip": {"from": 2, "to": 3}},
-        "current_thresholds": {
-            "deviation_signals": {"repeated_skip": 2, "l2_interruption": 1, "stagnation_days": 3},
-            "l2_protection": {"high": 0.75, "medium": 0.50},
-        },
-        "proposed_thresholds": {
-            "deviation_signals": {"repeated_skip": 3, "l2_interruption": 1, "stagnation_days": 3},
+    assert identity == ("atp_20260212091000", "gatfp_8e7f14f2fde04f47")
+
+
+_LIFECYCLE_GUARDIAN_AUTHORITY = {
+    "escalation": {
+        "window_days": 7,
+        "firm_reminder_resistance": 2,
+        "periodic_check_resistance": 4,
+    },
+    "safe_mode": {
+        "enabled": True,
+        "resistance_threshold": 5,
+        "min_response_events": 3,
+        "max_confirmation_ratio": 0.34,
+        "recovery_confirmations": 2,
+        "cooldown_hours": 24,
+    },
+}
+
+
+def _lifecycle_blueprint(*, repeated_skip):
+    return {
+        "intervention_level": "SOFT",
+        "guardian_thresholds": {
+            "deviation_signals": {
+                "repeated_skip": repeated_skip,
+                "l2_interruption": 1,
+                "stagnation_days": 3,
+            },
+            "l2_protection": {"high": 0.75, "medium": 0.50},
+        },
+        "guardian_authority": _LIFECYCLE_GUARDIAN_AUTHORITY,
+    }
+
+
+def test_apply_guardian_autotune_lifecycle_persists_thresholds(
+    monkeypatch, tmp_path, router_doubles
+):
+    config_path = tmp_path / "blueprint.yaml"
+    config_path.write_text(dump_yaml(_lifecycle_blueprint(repeated_skip=2)), encoding="utf-8")
+
+    proposal_payload = {
+        "proposal_id": "atp_test_2",
+        "fingerprint": "gatfp_test_2",
+        "patch": {"repeated_skip": {"from": 2, "to": 3}},
+        "current_thresholds": {
+            "deviation_signals": {"repeated_skip": 2, "l2_interruption": 1, "stagnation_days": 3},
+            "l2_protection": {"high": 0.75, "medium": 0.50},
+        },
+        "proposed_thresholds": {
+            "deviation_signals": {"repeated_skip": 3, "l2_interruption": 1, "stagnation_days": 3},
             "l2_protection": {"high": 0.75, "medium": 0.50},
         },
     }
@@ -1038,68 +1107,32 @@ def test_apply_guardian_autotune_lifecycle_persists_thresholds(monkeypatch, tmp_
             }
         return None
 
-    monkeypatch.setattr(api_router, "BLUEPRINT_CONFIG_PATH", config_path)
-    monkeypatch.setattr(api_router, "_load_latest_event", fake_load_latest)
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
-    monkeypatch.setattr(api_router, "_current_autotune_mode", lambda: "assist")
-    monkeypatch.setattr(
-        api_router,
-        "build_guardian_retrospective_response",
-        lambda days=7: {"north_star_metrics": {"human_trust_index": {"score": 0.62}}},
-    )
-
     req = api_router.GuardianAutoTuneLifecycleActionRequest(
         proposal_id="atp_test_2",
         fingerprint="gatfp_test_2",
         reason="apply for experiment",
     )
-    payload = asyncio.run(api_router.apply_guardian_autotune_lifecycle(req))
+    monkeypatch.setattr(api_router, "BLUEPRINT_CONFIG_PATH", config_path)
+    monkeypatch.setattr(api_router, "_load_latest_event", fake_load_latest)
+    monkeypatch.setattr(api_router, "_current_autotune_mode", lambda: "assist")
+    router_doubles.snapshots.append({"north_star_metrics": {"human_trust_index": {"score": 0.62}}})
+    payload = _run(api_router.apply_guardian_autotune_lifecycle(req))
 
-    saved = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    saved = load_yaml(config_path.read_text(encoding="utf-8"))
     assert payload["status"] == "applied"
     assert payload["mode"] == "assist"
     assert saved["guardian_thresholds"]["deviation_signals"]["repeated_skip"] == 3
-    assert emitted and emitted[0]["type"] == api_router.AUTOTUNE_EVENT_APPLIED
-    assert emitted[0]["payload"]["trust_index_before"] == 0.62
+    assert router_doubles.emitted
+    assert router_doubles.emitted[0]["type"] == api_router.AUTOTUNE_EVENT_APPLIED
+    assert router_doubles.emitted[0]["payload"]["trust_index_before"] == 0.62
 
 
-def test_rollback_guardian_autotune_lifecycle_restores_previous_thresholds(monkeypatch, tmp_path):
+def test_rollback_guardian_autotune_lifecycle_restores_previous_thresholds(
+    monkeypatch, tmp_path, emitted_events
+):
     config_path = tmp_path / "blueprint.yaml"
-    config_path.write_text(
-        yaml.safe_dump(
-            {
-                "intervention_level": "SOFT",
-                "guardian_thresholds": {
-                    "deviation_signals": {
-                        "repeated_skip": 3,
-                        "l2_interruption": 1,
-                        "stagnation_days": 3,
-                    },
-                    "l2_protection": {"high": 0.75, "medium": 0.50},
-                },
-                "guardian_authority": {
-                    "escalation": {
-                        "window_days": 7,
-                        "firm_reminder_resistance": 2,
-                        "periodic_check_resistance": 4,
-                    },
-                    "safe_mode": {
-                        "enabled": True,
-                        "resistance_threshold": 5,
-                        "min_response_events": 3,
-                        "max_confirmation_ratio": 0.34,
-                        "recovery_confirmations": 2,
-                        "cooldown_hours": 24,
-                    },
-                },
-            },
-            sort_keys=False,
-            allow_unicode=True,
-        ),
-        encoding="utf-8",
-    )
+    config_path.write_text(dump_yaml(_lifecycle_blueprint(repeated_skip=3)), encoding="utf-8")
 
-    emitted = []
     applied_payload = {
         "proposal_id": "atp_test_3",
         "fingerprint": "gatfp_test_3",
@@ -1122,34 +1155,29 @@ def test_rollback_guardian_autotune_lifecycle_restores_previous_thresholds(monke
             }
         return None
 
-    monkeypatch.setattr(api_router, "BLUEPRINT_CONFIG_PATH", config_path)
-    monkeypatch.setattr(api_router, "_load_latest_event", fake_load_latest)
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
-    monkeypatch.setattr(api_router, "_current_autotune_mode", lambda: "assist")
-
     req = api_router.GuardianAutoTuneLifecycleActionRequest(
         proposal_id="atp_test_3",
         fingerprint="gatfp_test_3",
         reason="rollback due to trust drop",
     )
-    payload = asyncio.run(api_router.rollback_guardian_autotune_lifecycle(req))
+    monkeypatch.setattr(api_router, "BLUEPRINT_CONFIG_PATH", config_path)
+    monkeypatch.setattr(api_router, "_load_latest_event", fake_load_latest)
+    monkeypatch.setattr(api_router, "_current_autotune_mode", lambda: "assist")
+    payload = _run(api_router.rollback_guardian_autotune_lifecycle(req))
 
-    saved = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    saved = load_yaml(config_path.read_text(encoding="utf-8"))
     assert payload["status"] == "rolled_back"
     assert payload["mode"] == "assist"
     assert saved["guardian_thresholds"]["deviation_signals"]["repeated_skip"] == 2
-    assert emitted and emitted[0]["type"] == api_router.AUTOTUNE_EVENT_ROLLED_BACK
+    assert emitted_events and emitted_events[0]["type"] == api_router.AUTOTUNE_EVENT_ROLLED_BACK
 
 
 def test_review_guardian_autotune_lifecycle_requires_assist_mode(monkeypatch):
     monkeypatch.setattr(api_router, "_current_autotune_mode", lambda: "shadow")
     req = api_router.GuardianAutoTuneLifecycleActionRequest()
-    try:
-        asyncio.run(api_router.review_guardian_autotune_lifecycle(req))
-    except Exception as exc:
-        assert getattr(exc, "status_code", None) == 409
-    else:
-        assert False, "Expected 409 when autotune mode is not assist"
+    with pytest.raises(HTTPException) as excinfo:
+        _run(api_router.review_guardian_autotune_lifecycle(req))
+    assert excinfo.value.status_code == 409
 
 
 def test_autotune_rollback_recommendation_triggers_on_low_trust(monkeypatch):
@@ -1204,6 +1232,22 @@ def test_autotune_rollback_recommendation_triggers_on_low_trust(monkeypatch):
     assert "low_human_trust_index" in rec["reasons"]
 
 
+def test_autotune_history_chains_normalize_event_types(monkeypatch):
+    events = [
+        {"type": ["malformed"], "timestamp": "2026-02-09T07:00:00"},
+        {
+            "type": f" {api_router.AUTOTUNE_EVENT_PROPOSED}\n",
+            "timestamp": "2026-02-09T08:00:00",
+            "payload": {"proposal_id": "atp_padded", "fingerprint": "gatfp_padded"},
+        },
+    ]
+    monkeypatch.setattr(api_router, "_load_events_for_days", lambda days: events)
+
+    chains = api_router._autotune_lifecycle_history_chains(days=7)
+
+    assert [chain["proposal_id"] for chain in chains] == ["atp_padded"]
+
+
 def test_get_guardian_autotune_lifecycle_history_aggregates_metrics(monkeypatch):
     def proposal_payload(proposal_id, fingerprint, repeated_skip):
         return {
@@ -1296,15 +1340,10 @@ def test_get_guardian_autotune_lifecycle_history_aggregates_metrics(monkeypatch)
         },
     ]
 
-    class FixedDatetime(datetime):
-        @classmethod
-        def now(cls, tz=None):
-            return cls(2026, 2, 12, 12, 0, 0)
-
     monkeypatch.setattr(api_router, "_load_events_for_days", lambda days: events)
-    monkeypatch.setattr(api_router, "datetime", FixedDatetime)
+    monkeypatch.setattr(api_router, "_now", lambda: _FIXED_NOW)
 
-    payload = asyncio.run(api_router.get_guardian_autotune_lifecycle_history(days=30, limit=10))
+    payload = _run(api_router.get_guardian_autotune_lifecycle_history(days=30, limit=10))
     metrics = payload["metrics"]
     assert payload["total"] == 3
     assert metrics["autotune_review_turnaround_hours"]["median_hours"] == 1.0
@@ -1315,8 +1354,7 @@ def test_get_guardian_autotune_lifecycle_history_aggregates_metrics(monkeypatch)
     assert any(item["status"] == "rolled_back" for item in payload["history"])
 
 
-def test_evaluate_guardian_autotune_lifecycle_appends_event(monkeypatch):
-    emitted = []
+def test_evaluate_guardian_autotune_lifecycle_appends_event(monkeypatch, emitted_events):
     applied_event = {
         "type": api_router.AUTOTUNE_EVENT_APPLIED,
         "timestamp": "2026-01-01T08:00:00",
@@ -1338,29 +1376,24 @@ def test_evaluate_guardian_autotune_lifecycle_appends_event(monkeypatch):
     monkeypatch.setattr(api_router, "_find_autotune_rollback_within_horizon", lambda **kwargs: None)
     monkeypatch.setattr(api_router, "_current_human_trust_index", lambda days=7: 0.71)
     monkeypatch.setattr(api_router, "_autotune_lifecycle_state_snapshot", lambda: {"ok": True})
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
 
     req = api_router.GuardianAutoTuneLifecycleActionRequest(
         proposal_id="atp_eval_1",
         fingerprint="gatfp_eval_1",
         reason="manual check",
     )
-    payload = asyncio.run(api_router.evaluate_guardian_autotune_lifecycle(req))
+    payload = _run(api_router.evaluate_guardian_autotune_lifecycle(req))
 
     assert payload["status"] == "evaluated"
     assert payload["mode"] == "assist"
     assert payload["evaluation"]["trust_delta_48h"] == 0.09
     assert payload["evaluation"]["success_within_48h"] is True
-    assert emitted and emitted[0]["type"] == api_router.AUTOTUNE_EVENT_EVALUATED
+    assert emitted_events and emitted_events[0]["type"] == api_router.AUTOTUNE_EVENT_EVALUATED
 
 
-def test_evaluate_guardian_autotune_lifecycle_returns_pending_within_window(monkeypatch):
-    emitted = []
-
-    class FixedDatetime(datetime):
-        @classmethod
-        def now(cls, tz=None):
-            return cls(2026, 2, 12, 12, 0, 0)
+def test_evaluate_guardian_autotune_lifecycle_returns_pending_within_window(
+    monkeypatch, emitted_events
+):
 
     applied_event = {
         "type": api_router.AUTOTUNE_EVENT_APPLIED,
@@ -1372,7 +1405,7 @@ def test_evaluate_guardian_autotune_lifecycle_returns_pending_within_window(monk
         },
     }
 
-    monkeypatch.setattr(api_router, "datetime", FixedDatetime)
+    monkeypatch.setattr(api_router, "_now", lambda: _FIXED_NOW)
     monkeypatch.setattr(api_router, "_current_autotune_mode", lambda: "assist")
     monkeypatch.setattr(
         api_router,
@@ -1382,17 +1415,16 @@ def test_evaluate_guardian_autotune_lifecycle_returns_pending_within_window(monk
         ),
     )
     monkeypatch.setattr(api_router, "_autotune_lifecycle_state_snapshot", lambda: {"ok": True})
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
 
     req = api_router.GuardianAutoTuneLifecycleActionRequest(
         proposal_id="atp_eval_2",
         fingerprint="gatfp_eval_2",
     )
-    payload = asyncio.run(api_router.evaluate_guardian_autotune_lifecycle(req))
+    payload = _run(api_router.evaluate_guardian_autotune_lifecycle(req))
 
     assert payload["status"] == "pending_48h_window"
     assert payload["evaluation"]["horizon_hours"] == 48
-    assert emitted == []
+    assert emitted_events == []
 
 
 def test_autotune_history_prefers_evaluated_event_for_trust_delta(monkeypatch):
@@ -1452,7 +1484,7 @@ def test_autotune_history_prefers_evaluated_event_for_trust_delta(monkeypatch):
     ]
 
     monkeypatch.setattr(api_router, "_load_events_for_days", lambda days: events)
-    payload = asyncio.run(api_router.get_guardian_autotune_lifecycle_history(days=30, limit=10))
+    payload = _run(api_router.get_guardian_autotune_lifecycle_history(days=30, limit=10))
     history_item = payload["history"][0]
     metrics = payload["metrics"]
 
@@ -1501,7 +1533,7 @@ def test_get_guardian_autotune_evaluation_logs_filters_and_limits(monkeypatch):
     ]
 
     monkeypatch.setattr(api_router, "_load_events_for_days", lambda days: events)
-    payload = asyncio.run(api_router.get_guardian_autotune_evaluation_logs(days=14, limit=1))
+    payload = _run(api_router.get_guardian_autotune_evaluation_logs(days=14, limit=1))
     assert payload["window_days"] == 14
     assert payload["limit"] == 1
     assert payload["total"] == 1
@@ -1537,26 +1569,51 @@ def test_run_guardian_autotune_auto_evaluate_runs_due_targets(monkeypatch):
                 "proposal_id": "atp_due_1",
                 "fingerprint": "gatfp_due_1",
                 "applied_at": "2026-02-10T08:00:00",
-            }
+            },
+            {
+                "proposal_id": "atp_due_2",
+                "fingerprint": "gatfp_due_2",
+                "applied_at": "2026-02-10T09:00:00",
+            },
         ]
 
     monkeypatch.setattr(api_router, "_pending_autotune_evaluation_targets", fake_pending_targets)
 
-    async def fake_evaluate(request):
-        return {
-            "status": "evaluated",
-            "proposal_id": request.proposal_id,
-            "fingerprint": request.fingerprint,
-            "evaluation": {"trust_delta_48h": 0.05},
-        }
+    trust_reads = []
 
-    monkeypatch.setattr(api_router, "evaluate_guardian_autotune_lifecycle", fake_evaluate)
+    def fake_trust_index(days=7):
+        trust_reads.append(days)
+        return 0.7
 
-    payload = asyncio.run(api_router._run_guardian_autotune_auto_evaluate(trigger="cycle"))
+    def fake_evaluate(request, *, load_trust_index):
+        return (
+            {
+                "status": "evaluated",
+                "proposal_id": request.proposal_id,
+                "fingerprint": request.fingerprint,
+                "evaluation": {"trust_index_after": load_trust_index()},
+            },
+            {
+                "type": api_router.AUTOTUNE_EVENT_EVALUATED,
+                "timestamp": "2026-02-12T12:00:00",
+                "payload": {"proposal_id": request.proposal_id},
+            },
+        )
+
+    batches = []
+    monkeypatch.setattr(api_router, "_evaluate_autotune_apply", fake_evaluate)
+    monkeypatch.setattr(api_router, "_current_human_trust_index", fake_trust_index)
+    monkeypatch.setattr(api_router, "append_events", batches.append)
+
+    payload = _run(api_router._run_guardian_autotune_auto_evaluate(trigger="cycle"))
     assert payload["status"] == "completed"
+    assert len(batches) == 1
+    assert [event["payload"]["proposal_id"] for event in batches[0]] == ["atp_due_1", "atp_due_2"]
+    assert trust_reads == [7]
     assert payload["mode"] == "assist"
-    assert payload["evaluated_count"] == 1
+    assert payload["evaluated_count"] == 2
     assert payload["results"][0]["status"] == "evaluated"
+    assert payload["results"][1]["evaluation"]["trust_index_after"] == 0.7
     assert payload["config"]["horizon_hours"] == 72
     assert payload["config"]["lookback_days"] == 120
     assert payload["config"]["max_targets_per_cycle"] == 5
@@ -1565,6 +1622,49 @@ def test_run_guardian_autotune_auto_evaluate_runs_due_targets(monkeypatch):
     assert captured["kwargs"]["limit"] == 5
 
 
+def test_run_guardian_autotune_auto_evaluate_reports_unsaved_targets_as_errors(monkeypatch):
+    monkeypatch.setattr(
+        api_router,
+        "_load_blueprint_yaml",
+        lambda: {"guardian_autotune": {"enabled": True, "mode": "assist"}},
+    )
+    monkeypatch.setattr(
+        api_router,
+        "_pending_autotune_evaluation_targets",
+        lambda **kwargs: [
+            {"proposal_id": "atp_due_1", "fingerprint": "gatfp_due_1"},
+            {"proposal_id": "atp_done", "fingerprint": "gatfp_done"},
+        ],
+    )
+    monkeypatch.setattr(api_router, "_current_human_trust_index", lambda days=7: 0.7)
+
+    def fake_evaluate(request, *, load_trust_index):
+        if request.proposal_id == "atp_done":
+            return {"status": "already_evaluated", "evaluation": {}}, None
+        event = {"type": api_router.AUTOTUNE_EVENT_EVALUATED, "payload": {}}
+        return {"status": "evaluated", "evaluation": {}}, event
+
+    def failing_append(events):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(api_router, "_evaluate_autotune_apply", fake_evaluate)
+    monkeypatch.setattr(api_router, "append_events", failing_append)
+
+    payload = _run(api_router._run_guardian_autotune_auto_evaluate(trigger="cycle"))
+
+    assert payload["status"] == "partial"
+    assert payload["evaluated_count"] == 0
+    assert [item["proposal_id"] for item in payload["results"]] == ["atp_done"]
+    assert payload["errors"] == [
+        {
+            "proposal_id": "atp_due_1",
+            "fingerprint": "gatfp_due_1",
+            "status_code": 500,
+            "detail": "disk full",
+        }
+    ]
+
+
 def test_run_guardian_autotune_auto_evaluate_skips_when_config_disabled(monkeypatch):
     monkeypatch.setattr(
         api_router,
@@ -1577,164 +1677,94 @@ def test_run_guardian_autotune_auto_evaluate_skips_when_config_disabled(monkeypa
             }
         },
     )
-    payload = asyncio.run(api_router._run_guardian_autotune_auto_evaluate(trigger="cycle"))
+    payload = _run(api_router._run_guardian_autotune_auto_evaluate(trigger="cycle"))
     assert payload["status"] == "skipped"
     assert payload["reason"] == "auto_evaluate_disabled"
     assert payload["evaluated_count"] == 0
 
 
-def test_confirm_retrospective_intervention_appends_confirmation_event(monkeypatch):
-    emitted = []
-    snapshots = [
-        {
-            "period": {"days": 7},
-            "suggestion": "keep focus",
-            "display": True,
-            "require_confirm": True,
-            "suggestion_sources": [{"signal": "repeated_skip"}],
-            "response_action": {
-                "required": True,
-                "pending": True,
-                "fingerprint": "gcf_test_1",
-                "latest": None,
-            },
-            "confirmation_action": {
-                "required": True,
-                "confirmed": False,
-                "fingerprint": "gcf_test_1",
-            },
+_IDLE_AUTHORITY = {"safe_mode": {"active": False, "recommendation": {}}}
+
+
+def _retrospective_snapshot(
+    fingerprint,
+    *,
+    required=False,
+    pending=False,
+    require_confirm=False,
+    confirmed=False,
+    latest_action=None,
+    latest_at="2026-02-11T12:10:00",
+    signals=("repeated_skip",),
+    authority=_IDLE_AUTHORITY,
+):
+    latest = (
+        {"action": latest_action, "fingerprint": fingerprint, "timestamp": latest_at}
+        if latest_action
+        else None
+    )
+    snapshot = {
+        "period": {"days": 7},
+        "suggestion": "keep focus",
+        "display": True,
+        "require_confirm": require_confirm,
+        "suggestion_sources": [{"signal": signal} for signal in signals],
+        "response_action": {
+            "required": required,
+            "pending": pending,
+            "fingerprint": fingerprint,
+            "latest": latest,
         },
-        {
-            "period": {"days": 7},
-            "suggestion": "keep focus",
-            "display": True,
-            "require_confirm": False,
-            "suggestion_sources": [{"signal": "repeated_skip"}],
-            "response_action": {
-                "required": True,
-                "pending": False,
-                "fingerprint": "gcf_test_1",
-                "latest": {
-                    "action": "confirm",
-                    "fingerprint": "gcf_test_1",
-                    "timestamp": "2026-02-11T12:00:00",
-                },
-            },
-            "confirmation_action": {
-                "required": True,
-                "confirmed": True,
-                "fingerprint": "gcf_test_1",
-            },
+        "confirmation_action": {
+            "required": required,
+            "confirmed": confirmed,
+            "fingerprint": fingerprint,
         },
-    ]
+    }
+    if authority is not None:
+        snapshot["authority"] = copy.deepcopy(authority)
+    return snapshot
 
-    def fake_build(days=7):
-        return snapshots.pop(0)
 
-    monkeypatch.setattr(api_router, "build_guardian_retrospective_response", fake_build)
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
+def test_confirm_retrospective_intervention_appends_confirmation_event(router_doubles):
+    router_doubles.snapshots.extend(
+        [
+            _retrospective_snapshot(
+                "gcf_test_1", required=True, pending=True, require_confirm=True, authority=None
+            ),
+            _retrospective_snapshot(
+                "gcf_test_1",
+                required=True,
+                confirmed=True,
+                latest_action="confirm",
+                latest_at="2026-02-11T12:00:00",
+                authority=None,
+            ),
+        ]
+    )
 
     req = api_router.RetrospectiveConfirmRequest(
         days=7,
         fingerprint="gcf_test_1",
         context="recovering",
     )
-    payload = asyncio.run(api_router.confirm_retrospective_intervention(req))
+    payload = _run_sync(api_router.confirm_retrospective_intervention(req))
 
     assert payload["status"] == "confirmed"
-    assert emitted
-    assert emitted[0]["type"] == "guardian_intervention_confirmed"
-    assert emitted[0]["payload"]["fingerprint"] == "gcf_test_1"
-    assert emitted[0]["payload"]["context"] == "recovering"
-    assert emitted[0]["payload"]["signals"] == ["repeated_skip"]
+    assert router_doubles.emitted
+    assert router_doubles.emitted[0]["type"] == "guardian_intervention_confirmed"
+    assert router_doubles.emitted[0]["payload"]["fingerprint"] == "gcf_test_1"
+    assert router_doubles.emitted[0]["payload"]["context"] == "recovering"
+    assert router_doubles.emitted[0]["payload"]["signals"] == ["repeated_skip"]
 
 
-def test_confirm_retrospective_intervention_rejects_stale_fingerprint(monkeypatch):
-    monkeypatch.setattr(
-        api_router,
-        "build_guardian_retrospective_response",
-        lambda days=7: {
-            "period": {"days": 7},
-            "suggestion": "keep focus",
-            "display": True,
-            "require_confirm": True,
-            "suggestion_sources": [],
-            "response_action": {
-                "required": True,
-                "pending": True,
-                "fingerprint": "gcf_latest",
-                "latest": None,
-            },
-            "confirmation_action": {
-                "required": True,
-                "confirmed": False,
-                "fingerprint": "gcf_latest",
-            },
-        },
-    )
-
-    req = api_router.RetrospectiveConfirmRequest(days=7, fingerprint="gcf_old")
-    try:
-        asyncio.run(api_router.confirm_retrospective_intervention(req))
-    except Exception as exc:  # FastAPI HTTPException
-        assert getattr(exc, "status_code", None) == 409
-    else:  # pragma: no cover - defensive
-        assert False, "Expected 409 for stale fingerprint"
-
-
-def test_respond_retrospective_intervention_appends_response_event(monkeypatch):
-    emitted = []
-    snapshots = [
-        {
-            "period": {"days": 7},
-            "suggestion": "keep focus",
-            "display": True,
-            "require_confirm": False,
-            "suggestion_sources": [{"signal": "repeated_skip"}],
-            "response_action": {
-                "required": False,
-                "pending": False,
-                "fingerprint": "gcf_resp_1",
-                "latest": None,
-            },
-            "confirmation_action": {
-                "required": False,
-                "confirmed": False,
-                "fingerprint": "gcf_resp_1",
-            },
-            "authority": {"safe_mode": {"active": False, "recommendation": {}}},
-        },
-        {
-            "period": {"days": 7},
-            "suggestion": "keep focus",
-            "display": True,
-            "require_confirm": False,
-            "suggestion_sources": [{"signal": "repeated_skip"}],
-            "response_action": {
-                "required": False,
-                "pending": False,
-                "fingerprint": "gcf_resp_1",
-                "latest": {
-                    "action": "dismiss",
-                    "fingerprint": "gcf_resp_1",
-                    "timestamp": "2026-02-11T12:10:00",
-                },
-            },
-            "confirmation_action": {
-                "required": False,
-                "confirmed": False,
-                "fingerprint": "gcf_resp_1",
-            },
-            "authority": {"safe_mode": {"active": False, "recommendation": {}}},
-        },
-    ]
-
-    monkeypatch.setattr(
-        api_router,
-        "build_guardian_retrospective_response",
-        lambda days=7: snapshots.pop(0),
+def test_respond_retrospective_intervention_appends_response_event(router_doubles):
+    router_doubles.snapshots.extend(
+        [
+            _retrospective_snapshot("gcf_resp_1"),
+            _retrospective_snapshot("gcf_resp_1", latest_action="dismiss"),
+        ]
     )
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
 
     req = api_router.RetrospectiveRespondRequest(
         days=7,
@@ -1742,356 +1772,225 @@ def test_respond_retrospective_intervention_appends_response_event(monkeypatch):
         action="dismiss",
         context="instinct_escape",
     )
-    payload = asyncio.run(api_router.respond_retrospective_intervention(req))
+    payload = _run_sync(api_router.respond_retrospective_intervention(req))
 
     assert payload["status"] == "responded"
     assert payload["action"] == "dismiss"
-    assert emitted and emitted[0]["type"] == "guardian_intervention_responded"
-    assert emitted[0]["payload"]["fingerprint"] == "gcf_resp_1"
-    assert emitted[0]["payload"]["context"] == "instinct_escape"
-
-
-def test_respond_retrospective_intervention_rejects_invalid_context(monkeypatch):
-    monkeypatch.setattr(
-        api_router,
-        "build_guardian_retrospective_response",
-        lambda days=7: {
-            "period": {"days": 7},
-            "suggestion": "keep focus",
-            "display": True,
-            "require_confirm": False,
-            "suggestion_sources": [],
-            "response_action": {
-                "required": False,
-                "pending": False,
-                "fingerprint": "gcf_ctx",
-                "latest": None,
-            },
-            "confirmation_action": {
-                "required": False,
-                "confirmed": False,
-                "fingerprint": "gcf_ctx",
-            },
-            "authority": {"safe_mode": {"active": False, "recommendation": {}}},
-        },
-    )
-    req = api_router.RetrospectiveRespondRequest(
-        days=7,
-        fingerprint="gcf_ctx",
-        action="dismiss",
-        context="invalid_context",
-    )
-    try:
-        asyncio.run(api_router.respond_retrospective_intervention(req))
-    except Exception as exc:
-        assert getattr(exc, "status_code", None) == 400
-    else:
-        assert False, "Expected 400 for invalid guardian response context"
+    assert router_doubles.emitted
+    assert router_doubles.emitted[0]["type"] == "guardian_intervention_responded"
+    assert router_doubles.emitted[0]["payload"]["fingerprint"] == "gcf_resp_1"
+    assert router_doubles.emitted[0]["payload"]["context"] == "instinct_escape"
 
 
-def test_respond_retrospective_intervention_can_enter_safe_mode(monkeypatch):
-    emitted = []
-    snapshots = [
-        {
-            "period": {"days": 7},
-            "suggestion": "keep focus",
-            "display": True,
-            "require_confirm": False,
-            "suggestion_sources": [{"signal": "repeated_skip"}],
-            "response_action": {
-                "required": False,
-                "pending": False,
-                "fingerprint": "gcf_safe_1",
-                "latest": None,
-            },
-            "confirmation_action": {
-                "required": False,
-                "confirmed": False,
-                "fingerprint": "gcf_safe_1",
-            },
-            "authority": {"safe_mode": {"active": False, "recommendation": {}}},
-        },
-        {
-            "period": {"days": 7},
-            "suggestion": "keep focus",
-            "display": True,
-            "require_confirm": False,
-            "suggestion_sources": [{"signal": "repeated_skip"}],
-            "response_action": {
-                "required": False,
-                "pending": False,
-                "fingerprint": "gcf_safe_1",
-                "latest": {
-                    "action": "dismiss",
-                    "fingerprint": "gcf_safe_1",
-                    "timestamp": "2026-02-11T12:10:00",
+def test_respond_retrospective_intervention_can_enter_safe_mode(router_doubles):
+    router_doubles.snapshots.extend(
+        [
+            _retrospective_snapshot("gcf_safe_1"),
+            _retrospective_snapshot(
+                "gcf_safe_1",
+                latest_action="dismiss",
+                authority={
+                    "safe_mode": {
+                        "active": False,
+                        "cooldown_complete": True,
+                        "recommendation": {
+                            "should_enter": True,
+                            "should_exit": False,
+                            "reason": "high_resistance_low_follow_through",
+                            "response_count": 4,
+                            "resistance_count": 4,
+                            "confirmation_ratio": 0.0,
+                        },
+                    }
                 },
-            },
-            "confirmation_action": {
-                "required": False,
-                "confirmed": False,
-                "fingerprint": "gcf_safe_1",
-            },
-            "authority": {
-                "safe_mode": {
-                    "active": False,
-                    "cooldown_complete": True,
-                    "recommendation": {
-                        "should_enter": True,
-                        "should_exit": False,
-                        "reason": "high_resistance_low_follow_through",
-                        "response_count": 4,
-                        "resistance_count": 4,
-                        "confirmation_ratio": 0.0,
-                    },
-                }
-            },
-        },
-        {
-            "period": {"days": 7},
-            "suggestion": "keep focus",
-            "display": True,
-            "require_confirm": False,
-            "suggestion_sources": [{"signal": "repeated_skip"}],
-            "response_action": {
-                "required": False,
-                "pending": False,
-                "fingerprint": "gcf_safe_1",
-                "latest": {
-                    "action": "dismiss",
-                    "fingerprint": "gcf_safe_1",
-                    "timestamp": "2026-02-11T12:10:00",
+            ),
+            _retrospective_snapshot(
+                "gcf_safe_1",
+                latest_action="dismiss",
+                authority={
+                    "safe_mode": {
+                        "active": True,
+                        "entered_at": "2026-02-11T12:11:00",
+                        "recommendation": {"should_enter": False, "should_exit": False},
+                    }
                 },
-            },
-            "confirmation_action": {
-                "required": False,
-                "confirmed": False,
-                "fingerprint": "gcf_safe_1",
-            },
-            "authority": {
-                "safe_mode": {
-                    "active": True,
-                    "entered_at": "2026-02-11T12:11:00",
-                    "recommendation": {"should_enter": False, "should_exit": False},
-                }
-            },
-        },
-    ]
-
-    monkeypatch.setattr(
-        api_router,
-        "build_guardian_retrospective_response",
-        lambda days=7: snapshots.pop(0),
+            ),
+        ]
     )
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
 
     req = api_router.RetrospectiveRespondRequest(
         days=7,
         fingerprint="gcf_safe_1",
         action="dismiss",
     )
-    payload = asyncio.run(api_router.respond_retrospective_intervention(req))
+    payload = _run_sync(api_router.respond_retrospective_intervention(req))
 
     assert payload["status"] == "responded"
     assert payload["safe_mode_transition"] == "entered"
-    assert any(event["type"] == "guardian_safe_mode_entered" for event in emitted)
+    assert "guardian_safe_mode_entered" in {event["type"] for event in router_doubles.emitted}
 
 
-def test_respond_retrospective_confirm_works_in_soft_mode(monkeypatch):
-    emitted = []
-    snapshots = [
-        {
-            "period": {"days": 7},
-            "suggestion": "keep focus",
-            "display": True,
-            "require_confirm": False,
-            "suggestion_sources": [{"signal": "repeated_skip"}],
-            "response_action": {
-                "required": False,
-                "pending": False,
-                "fingerprint": "gcf_soft_confirm",
-                "latest": None,
-            },
-            "confirmation_action": {
-                "required": False,
-                "confirmed": False,
-                "fingerprint": "gcf_soft_confirm",
-            },
-            "authority": {"safe_mode": {"active": False, "recommendation": {}}},
-        },
-        {
-            "period": {"days": 7},
-            "suggestion": "keep focus",
-            "display": True,
-            "require_confirm": False,
-            "suggestion_sources": [{"signal": "repeated_skip"}],
-            "response_action": {
-                "required": False,
-                "pending": False,
-                "fingerprint": "gcf_soft_confirm",
-                "latest": {
-                    "action": "confirm",
-                    "fingerprint": "gcf_soft_confirm",
-                    "timestamp": "2026-02-11T12:10:00",
-                },
-            },
-            "confirmation_action": {
-                "required": False,
-                "confirmed": True,
-                "fingerprint": "gcf_soft_confirm",
-            },
-            "authority": {"safe_mode": {"active": False, "recommendation": {}}},
-        },
-    ]
-    monkeypatch.setattr(
-        api_router,
-        "build_guardian_retrospective_response",
-        lambda days=7: snapshots.pop(0),
+def test_respond_retrospective_confirm_works_in_soft_mode(router_doubles):
+    router_doubles.snapshots.extend(
+        [
+            _retrospective_snapshot("gcf_soft_confirm"),
+            _retrospective_snapshot("gcf_soft_confirm", confirmed=True, latest_action="confirm"),
+        ]
     )
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
-
     req = api_router.RetrospectiveRespondRequest(
         days=7,
         fingerprint="gcf_soft_confirm",
         action="confirm",
     )
-    payload = asyncio.run(api_router.respond_retrospective_intervention(req))
+    payload = _run_sync(api_router.respond_retrospective_intervention(req))
 
     assert payload["status"] == "confirmed"
-    assert emitted and emitted[0]["type"] == "guardian_intervention_confirmed"
-
+    assert router_doubles.emitted
+    assert router_doubles.emitted[0]["type"] == "guardian_intervention_confirmed"
 
-def test_start_l2_session_appends_event(monkeypatch):
-    emitted = []
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
-    monkeypatch.setattr(
-        api_router,
-        "build_guardian_retrospective_response",
-        lambda days=7: {"l2_session": {"active_session": True, "active_session_id": "sess_1"}},
-    )
 
+def test_start_l2_session_appends_event(router_doubles):
     req = api_router.L2SessionActionRequest(
         session_id="sess_1",
         note="deep work",
         intention="Finish the proposal draft section.",
     )
-    payload = asyncio.run(api_router.start_l2_session(req))
+    router_doubles.snapshots.append(
+        {"l2_session": {"active_session": True, "active_session_id": "sess_1"}}
+    )
+    payload = _run_sync(api_router.start_l2_session(req))
 
     assert payload["status"] == "started"
     assert payload["session_id"] == "sess_1"
-    assert emitted and emitted[0]["type"] == "l2_session_started"
-    assert emitted[0]["payload"]["session_id"] == "sess_1"
-    assert emitted[0]["payload"]["intention"] == "Finish the proposal draft section."
+    assert router_doubles.emitted
+    assert router_doubles.emitted[0]["type"] == "l2_session_started"
+    assert router_doubles.emitted[0]["payload"]["session_id"] == "sess_1"
+    assert router_doubles.emitted[0]["payload"]["intention"] == "Finish the proposal draft section."
 
 
-def test_resume_l2_session_appends_event(monkeypatch):
-    emitted = []
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
+def test_resume_l2_session_appends_event(monkeypatch, router_doubles):
+    req = api_router.L2SessionActionRequest(resume_step="Re-enter by executing first TODO.")
     monkeypatch.setattr(api_router, "_resolve_resumable_l2_session_id", lambda: "sess_2")
-    monkeypatch.setattr(
-        api_router,
-        "build_guardian_retrospective_response",
-        lambda days=7: {"l2_session": {"active_session": True, "active_session_id": "sess_2"}},
+    router_doubles.snapshots.append(
+        {"l2_session": {"active_session": True, "active_session_id": "sess_2"}}
     )
-
-    req = api_router.L2SessionActionRequest(resume_step="Re-enter by executing first TODO.")
-    payload = asyncio.run(api_router.resume_l2_session(req))
+    payload = _run_sync(api_router.resume_l2_session(req))
 
     assert payload["status"] == "resumed"
     assert payload["session_id"] == "sess_2"
-    assert emitted and emitted[0]["type"] == "l2_session_resumed"
-    assert emitted[0]["payload"]["resume_step"] == "Re-enter by executing first TODO."
-
-
-def test_resume_l2_session_requires_interrupt(monkeypatch):
-    monkeypatch.setattr(api_router, "_resolve_resumable_l2_session_id", lambda: None)
-
-    req = api_router.L2SessionActionRequest()
-    try:
-        asyncio.run(api_router.resume_l2_session(req))
-    except Exception as exc:
-        assert getattr(exc, "status_code", None) == 400
-    else:
-        assert False, "Expected 400 when no interrupted L2 session is available"
-
-
-def test_interrupt_l2_session_appends_event(monkeypatch):
-    emitted = []
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
-    monkeypatch.setattr(
-        api_router,
-        "build_guardian_retrospective_response",
-        lambda days=7: {"l2_session": {"active_session": False, "active_session_id": None}},
+    assert router_doubles.emitted
+    assert router_doubles.emitted[0]["type"] == "l2_session_resumed"
+    assert router_doubles.emitted[0]["payload"]["resume_step"] == (
+        "Re-enter by executing first TODO."
     )
 
+
+def test_interrupt_l2_session_appends_event(router_doubles):
     req = api_router.L2SessionActionRequest(session_id="sess_2", reason="energy_drop")
-    payload = asyncio.run(api_router.interrupt_l2_session(req))
+    router_doubles.snapshots.append(
+        {"l2_session": {"active_session": False, "active_session_id": None}}
+    )
+    payload = _run_sync(api_router.interrupt_l2_session(req))
 
     assert payload["status"] == "interrupted"
     assert payload["session_id"] == "sess_2"
     assert payload["reason"] == "energy_drop"
-    assert emitted and emitted[0]["type"] == "l2_session_interrupted"
-    assert emitted[0]["payload"]["reason"] == "energy_drop"
-
+    assert router_doubles.emitted
+    assert router_doubles.emitted[0]["type"] == "l2_session_interrupted"
+    assert router_doubles.emitted[0]["payload"]["reason"] == "energy_drop"
 
-def test_interrupt_l2_session_rejects_invalid_reason(monkeypatch):
-    monkeypatch.setattr(
-        api_router,
-        "build_guardian_retrospective_response",
-        lambda days=7: {"l2_session": {"active_session": True, "active_session_id": "sess_x"}},
-    )
-    req = api_router.L2SessionActionRequest(reason="invalid_reason")
-    try:
-        asyncio.run(api_router.interrupt_l2_session(req))
-    except Exception as exc:
-        assert getattr(exc, "status_code", None) == 400
-    else:
-        assert False, "Expected 400 for invalid l2 interrupt reason"
 
-
-def test_complete_l2_session_requires_active_session(monkeypatch):
-    monkeypatch.setattr(api_router, "_resolve_active_l2_session_id", lambda: None)
-    req = api_router.L2SessionActionRequest()
-    try:
-        asyncio.run(api_router.complete_l2_session(req))
-    except Exception as exc:
-        assert getattr(exc, "status_code", None) == 400
-    else:
-        assert False, "Expected 400 when no active L2 session is available"
-
-
-def test_complete_l2_session_appends_reflection(monkeypatch):
-    emitted = []
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
+def test_complete_l2_session_appends_reflection(monkeypatch, router_doubles):
+    req = api_router.L2SessionActionRequest(reflection="Closed the hardest part first.")
     monkeypatch.setattr(api_router, "_resolve_active_l2_session_id", lambda: "sess_3")
-    monkeypatch.setattr(
-        api_router,
-        "build_guardian_retrospective_response",
-        lambda days=7: {"l2_session": {"active_session": False, "active_session_id": None}},
+    router_doubles.snapshots.append(
+        {"l2_session": {"active_session": False, "active_session_id": None}}
     )
-    req = api_router.L2SessionActionRequest(reflection="Closed the hardest part first.")
-    payload = asyncio.run(api_router.complete_l2_session(req))
+    payload = _run_sync(api_router.complete_l2_session(req))
 
     assert payload["status"] == "completed"
     assert payload["session_id"] == "sess_3"
-    assert emitted and emitted[0]["type"] == "l2_session_completed"
-    assert emitted[0]["payload"]["reflection"] == "Closed the hardest part first."
+    assert router_doubles.emitted
+    assert router_doubles.emitted[0]["type"] == "l2_session_completed"
+    assert router_doubles.emitted[0]["payload"]["reflection"] == "Closed the hardest part first."
 
 
-def test_steward_anchor_filter_records_reasons(tmp_path):
-    registry = GoalRegistry(path=tmp_path / "goal_registry.json")
+_REJECTED_GUARDIAN_REQUESTS = {
+    "confirm-stale-fingerprint": (
+        api_router.confirm_retrospective_intervention,
+        api_router.RetrospectiveConfirmRequest(days=7, fingerprint="gcf_old"),
+        {
+            "build_guardian_retrospective_response": lambda days=7: _retrospective_snapshot(
+                "gcf_latest",
+                required=True,
+                pending=True,
+                require_confirm=True,
+                signals=(),
+                authority=None,
+            )
+        },
+        409,
+    ),
+    "respond-invalid-context": (
+        api_router.respond_retrospective_intervention,
+        api_router.RetrospectiveRespondRequest(
+            days=7,
+            fingerprint="gcf_ctx",
+            action="dismiss",
+            context="invalid_context",
+        ),
+        {
+            "build_guardian_retrospective_response": lambda days=7: _retrospective_snapshot(
+                "gcf_ctx", signals=()
+            )
+        },
+        400,
+    ),
+    "resume-without-interrupt": (
+        api_router.resume_l2_session,
+        api_router.L2SessionActionRequest(),
+        {"_resolve_resumable_l2_session_id": lambda: None},
+        400,
+    ),
+    "interrupt-invalid-reason": (
+        api_router.interrupt_l2_session,
+        api_router.L2SessionActionRequest(reason="invalid_reason"),
+        {
+            "build_guardian_retrospective_response": lambda days=7: {
+                "l2_session": {"active_session": True, "active_session_id": "sess_x"}
+            }
+        },
+        400,
+    ),
+    "complete-without-active-session": (
+        api_router.complete_l2_session,
+        api_router.L2SessionActionRequest(),
+        {"_resolve_active_l2_session_id": lambda: None},
+        400,
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "endpoint, req, overrides, expected_status",
+    list(_REJECTED_GUARDIAN_REQUESTS.values()),
+    ids=list(_REJECTED_GUARDIAN_REQUESTS),
+)
+def test_guardian_endpoints_reject_invalid_requests(
+    monkeypatch, endpoint, req, overrides, expected_status
+):
+    for name, value in overrides.items():
+        monkeypatch.setattr(api_router, name, value)
+    with pytest.raises(HTTPException) as excinfo:
+        _run_sync(endpoint(req))
+    assert excinfo.value.status_code == expected_status
+
+
+def test_steward_anchor_filter_records_reasons(anchor_manager):
+    registry = GoalRegistry.in_memory()
     steward = Steward(state={}, registry=registry)
 
-    class DummyAnchor:
-        version = "v_anchor"
-        anti_values = ("doomscroll",)
-
-    class DummyAnchorManager:
-        @staticmethod
-        def get_current():
-            return DummyAnchor()
-
-    steward._anchor_manager = DummyAnchorManager()
+    steward._anchor_manager = anchor_manager
     steward._anchor_blocked_actions = []
     steward._active_anchor_version = None
 
@@ -2104,124 +2003,208 @@ def test_steward_anchor_filter_records_reasons(tmp_path):
 
     assert len(filtered) == 1
     assert filtered[0]["id"] == "a2"
-    assert steward._active_anchor_version == "v_anchor"
+    assert steward._active_anchor_version == "v1"
     assert steward._anchor_blocked_actions[0]["action_id"] == "a1"
     assert steward._anchor_blocked_actions[0]["anti_value"] == "doomscroll"
 
 
-def test_activate_anchor_triggers_recompute_and_effect_event(monkeypatch, tmp_path):
-    blueprint = tmp_path / "better_human_blueprint.md"
+_NO_CHANGES = frozenset()
+_ANCHOR_V1_TO_V2_DIFF = SimpleNamespace(
+    status="changed",
+    version_change="v1 -> v2",
+    added_non_negotiables=_NO_CHANGES,
+    removed_non_negotiables=_NO_CHANGES,
+    added_commitments=frozenset({"ship weekly"}),
+    removed_commitments=_NO_CHANGES,
+    added_anti_values=_NO_CHANGES,
+    removed_anti_values=_NO_CHANGES,
+    added_adversaries=_NO_CHANGES,
+    removed_adversaries=_NO_CHANGES,
+)
+
+
+@dataclass(frozen=True)
+class _DummyAnchor:
+    version: str
+    confirmed_by_user: bool
+    created_at: str = "2026-02-11T00:00:00"
+    non_negotiables: tuple = ()
+    long_horizon_commitments: tuple = ("ship weekly",)
+    anti_values: tuple = ("doomscroll",)
+    instinct_adversaries: tuple = ()
+    source_hash: str = "hash"
+
+
+class _DummyAnchorManager:
+    def __init__(self):
+        self.current = _DummyAnchor("v1", True)
+
+    def get_current(self):
+        return self.current
+
+    @staticmethod
+    def generate_draft(path):
+        assert path.endswith("better_human_blueprint.md")
+        return _DummyAnchor("v2", False)
+
+    @staticmethod
+    def diff(old, new):
+        assert (old.version, new.version) == ("v1", "v2")
+        return _ANCHOR_V1_TO_V2_DIFF
+
+    def activate(self, anchor):
+        self.current = _DummyAnchor(anchor.version, True)
+        return self.current
+
+
+class _DummyGoalService:
+    @staticmethod
+    def recompute_active_alignment(detail_limit=100):
+        return {
+            "total_processed": 3,
+            "affected_count": 2,
+            "avg_score_delta": 8.0,
+            "before": {
+                "total_active": 3,
+                "avg_score": 55.0,
+                "distribution": {"high": 0, "medium": 2, "low": 1, "unknown": 0},
+            },
+            "after": {
+                "total_active": 3,
+                "avg_score": 63.0,
+                "distribution": {"high": 1, "medium": 2, "low": 0, "unknown": 0},
+            },
+            "impacted_goals": [{"goal_id": "g_1"}],
+        }
+
+
+@pytest.fixture(scope="module")
+def anchor_blueprint_path(tmp_path_factory):
+    blueprint = tmp_path_factory.mktemp("anchor") / "better_human_blueprint.md"
     blueprint.write_text("blueprint", encoding="utf-8")
-    emitted = []
-
-    class DummyAnchor:
-        def __init__(self, version, confirmed_by_user):
-            self.version = version
-            self.created_at = "2026-02-11T00:00:00"
-            self.confirmed_by_user = confirmed_by_user
-            self.non_negotiables = ()
-            self.long_horizon_commitments = ("ship weekly",)
-            self.anti_values = ("doomscroll",)
-            self.instinct_adversaries = ()
-            self.source_hash = "hash"
-
-    class DummyAnchorManager:
-        def __init__(self):
-            self.current = DummyAnchor("v1", True)
+    return blueprint
 
-        def get_current(self):
-            return self.current
 
-        @staticmethod
-        def generate_draft(path):
-            assert path.endswith("better_human_blueprint.md")
-            return DummyAnchor("v2", False)
+def test_activate_anchor_triggers_recompute_and_effect_event(
+    monkeypatch, anchor_blueprint_path, emitted_events
+):
 
-        @staticmethod
-        def diff(old, new):
-            return SimpleNamespace(
-                status="changed",
-                version_change=f"{old.version} -> {new.version}",
-                added_non_negotiables=set(),
-                removed_non_negotiables=set(),
-                added_commitments={"ship weekly"},
-                removed_commitments=set(),
-                added_anti_values=set(),
-                removed_anti_values=set(),
-                added_adversaries=set(),
-                removed_adversaries=set(),
-            )
+    monkeypatch.setattr(api_router, "BLUEPRINT_PATH", anchor_blueprint_path)
+    monkeypatch.setattr(api_router, "AnchorManager", _DummyAnchorManager)
+    monkeypatch.setattr(api_router, "get_goal_service", _DummyGoalService)
 
-        def activate(self, anchor):
-            self.current = DummyAnchor(anchor.version, True)
-            return self.current
+    payload = _run(
+        api_router.activate_anchor(api_router.AnchorActivateRequest(force=False))
+    )
 
-    class DummyGoalService:
-        @staticmethod
-        def recompute_active_alignment(detail_limit=100):
-            return {
+    assert payload["status"] == "activated"
+    assert payload["effect"]["available"] is True
+    assert payload["effect"]["affected_count"] == 2
+    emitted_types = {event["type"] for event in emitted_events}
+    assert {"anchor_activated", "goal_alignment_recomputed"} <= emitted_types
+
+
+_ANCHOR_EFFECT_LOG_LINE = (
+    json.dumps(
+        {
+            "type": "goal_alignment_recomputed",
+            "timestamp": "2026-02-11T10:00:00",
+            "payload": {
+                "anchor_version": "v2",
                 "total_processed": 3,
                 "affected_count": 2,
                 "avg_score_delta": 8.0,
-                "before": {
-                    "total_active": 3,
-                    "avg_score": 55.0,
-                    "distribution": {"high": 0, "medium": 2, "low": 1, "unknown": 0},
-                },
-                "after": {
-                    "total_active": 3,
-                    "avg_score": 63.0,
-                    "distribution": {"high": 1, "medium": 2, "low": 0, "unknown": 0},
-                },
+                "before": {"total_active": 3, "avg_score": 55.0},
+                "after": {"total_active": 3, "avg_score": 63.0},
                 "impacted_goals": [{"goal_id": "g_1"}],
-            }
+            },
+        }
+    )
+    + "\n"
+)
 
-    monkeypatch.setattr(api_router, "BLUEPRINT_PATH", blueprint)
-    monkeypatch.setattr(api_router, "AnchorManager", DummyAnchorManager)
-    monkeypatch.setattr(api_router, "get_goal_service", lambda: DummyGoalService())
-    monkeypatch.setattr(api_router, "append_event", lambda event: emitted.append(event))
 
-    payload = asyncio.run(
-        api_router.activate_anchor(api_router.AnchorActivateRequest(force=False))
-    )
+@pytest.fixture(scope="module")
+def anchor_effect_event_log(tmp_path_factory):
+    event_log = tmp_path_factory.mktemp("anchor_effect") / "event_log.jsonl"
+    event_log.write_text(_ANCHOR_EFFECT_LOG_LINE, encoding="utf-8")
+    return event_log
 
-    assert payload["status"] == "activated"
-    assert payload["effect"]["available"] is True
-    assert payload["effect"]["affected_count"] == 2
-    assert any(event["type"] == "anchor_activated" for event in emitted)
-    assert any(event["type"] == "goal_alignment_recomputed" for event in emitted)
 
+def test_anchor_effect_returns_latest_recompute_event(monkeypatch, anchor_effect_event_log):
+    monkeypatch.setattr(api_router, "EVENT_LOG_PATH", anchor_effect_event_log)
+    payload = _run(api_router.get_anchor_effect())
 
-def test_anchor_effect_returns_latest_recompute_event(monkeypatch, tmp_path):
-    event_log = tmp_path / "event_log.jsonl"
-    event_log.write_text(
+    assert payload["available"] is True
+    assert payload["anchor_version"] == "v2"
+    assert payload["affected_count"] == 2
+    assert payload["generated_at"] == "2026-02-11T10:00:00"
+
+
+def test_load_events_for_days_skips_old_and_malformed_lines(monkeypatch, tmp_path):
+    log_path = tmp_path / "event_log.jsonl"
+    log_path.write_text(
         "\n".join(
             [
-                json.dumps(
-                    {
-                        "type": "goal_alignment_recomputed",
-                        "timestamp": "2026-02-11T10:00:00",
-                        "payload": {
-                            "anchor_version": "v2",
-                            "total_processed": 3,
-                            "affected_count": 2,
-                            "avg_score_delta": 8.0,
-                            "before": {"total_active": 3, "avg_score": 55.0},
-                            "after": {"total_active": 3, "avg_score": 63.0},
-                            "impacted_goals": [{"goal_id": "g_1"}],
-                        },
-                    }
-                )
+                json.dumps({"type": "old", "timestamp": "2026-01-01T08:00:00"}),
+                "",
+                "{not json",
+                "[1, 2]",
+                json.dumps({"type": "recent", "timestamp": "2026-02-11T08:00:00"}),
+                json.dumps({"type": "untimed"}, ensure_ascii=False),
             ]
         )
         + "\n",
         encoding="utf-8",
     )
+    monkeypatch.setattr(api_router, "EVENT_LOG_PATH", log_path)
+    monkeypatch.setattr(api_router, "_now", lambda: _FIXED_NOW)
+
+    events = api_router._load_events_for_days(7)
+
+    assert [event["type"] for event in events] == ["recent", "untimed"]
 
+
+def test_load_latest_event_tracks_appends_and_rewrites(monkeypatch, tmp_path):
+    event_log = tmp_path / "event_log.jsonl"
     monkeypatch.setattr(api_router, "EVENT_LOG_PATH", event_log)
-    payload = asyncio.run(api_router.get_anchor_effect())
+    assert api_router._load_latest_event("alpha") is None
 
-    assert payload["available"] is True
-    assert payload["anchor_version"] == "v2"
-    assert payload["affected_count"] == 2
-    assert payload["generated_at"] == "2026-02-11T10:00:00"
+    def line(event_type, value):
+        return json.dumps({"type": event_type, "payload": {"value": value}}) + "\n"
+
+    event_log.write_text(line("alpha", 1) + line("beta", 1), encoding="utf-8")
+    assert api_router._load_latest_event("alpha")["payload"]["value"] == 1
+
+    with open(event_log, "a", encoding="utf-8") as f:
+        f.write(line("alpha", 2))
+    assert api_router._load_latest_event("alpha")["payload"]["value"] == 2
+    assert api_router._load_latest_event("beta")["payload"]["value"] == 1
+
+    event_log.write_text(line("beta", 3), encoding="utf-8")
+    assert api_router._load_latest_event("alpha") is None
+    assert api_router._load_latest_event("beta")["payload"]["value"] == 3
+
+
+def test_load_latest_event_rebuilds_after_rewrite_to_larger_log(monkeypatch, tmp_path):
+    event_log = tmp_path / "event_log.jsonl"
+    monkeypatch.setattr(api_router, "EVENT_LOG_PATH", event_log)
+
+    def line(event_type, value, note=""):
+        payload = {"value": value, "note": note}
+        return json.dumps({"type": event_type, "payload": payload}) + "\n"
+
+    event_log.write_text(line("alpha", 1) + line("beta", 1), encoding="utf-8")
+    assert api_router._load_latest_event("beta")["payload"]["value"] == 1
+
+    # In-place rewrite (same inode) to a larger file, as the archiver does before appending.
+    event_log.write_text(line("beta", 2, note="migrated" * 8) + line("gamma", 1), encoding="utf-8")
+    assert api_router._load_latest_event("alpha") is None
+    assert api_router._load_latest_event("beta")["payload"]["value"] == 2
+
+    # Replacement through a new inode, as the schema migration's --apply does.
+    replacement = tmp_path / "event_log.jsonl.tmp"
+    replacement.write_text(line("delta", 1) + line("gamma", 2, note="x" * 64), encoding="utf-8")
+    os.replace(replacement, event_log)
+    assert api_router._load_latest_event("beta") is None
+    assert api_router._load_latest_event("gamma")["payload"]["value"] == 2
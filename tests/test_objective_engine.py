@@ -48,6 +48,22 @@ class TestObjectiveEngine:
         finally:
             registry_module.REGISTRY_PATH = original_path
 
+    def test_in_memory_registry_skips_disk(self, tmp_path):
+        import core.objective_engine.registry as registry_module
+        original_path = registry_module.REGISTRY_PATH
+        registry_module.REGISTRY_PATH = tmp_path / "goals.json"
+
+        try:
+            registry = GoalRegistry.in_memory()
+            registry.add_node(
+                ObjectiveNode(id="g1", title="G1", description="D1", layer=GoalLayer.GOAL)
+            )
+
+            assert registry.get_node("g1").title == "G1"
+            assert not registry_module.REGISTRY_PATH.exists()
+        finally:
+            registry_module.REGISTRY_PATH = original_path
+
     def test_priority_engine(self):
         engine = PriorityEngine(config)
         goal = ObjectiveNode(
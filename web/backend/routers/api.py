@@ -1,17 +1,29 @@
 import asyncio
+import copy
 import hashlib
 import json
+import os
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 import yaml
 
 from core.blueprint_anchor import AnchorManager
-from core.event_sourcing import EVENT_LOG_PATH, EVENT_SCHEMA_VERSION, append_event
+from core.config_cache import clear_cache, load_yaml_with_cache
+from core.event_log_cache import get_event_log_cache
+from core.event_sourcing import (
+    EVENT_LOG_PATH,
+    EVENT_SCHEMA_VERSION,
+    append_event,
+    append_events,
+    decode_event_line,
+)
 from core.feedback_classifier import classify_feedback
 from core.goal_service import GoalService
 from core.interaction_handler import InteractionHandler
@@ -24,6 +36,11 @@ from core.steward import Steward
 from core.utils import parse_llm_json
 from scheduler.daily_tick import ensure_tick_applied
 
+try:
+    from yaml import CSafeDumper as YamlSafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlSafeDumper
+
 router = APIRouter()
 
 
@@ -163,10 +180,15 @@ class GuardianAutoTuneConfigUpdateRequest(BaseModel):
 
 
 class GuardianAutoTuneRunRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     trigger: str = "manual"
 
 
 class GuardianAutoTuneLifecycleActionRequest(BaseModel):
+    # Handlers only read these; the auto-evaluate cycle builds one per due target.
+    model_config = ConfigDict(frozen=True)
+
     proposal_id: Optional[str] = None
     fingerprint: Optional[str] = None
     actor: Optional[str] = "human_operator"
@@ -226,10 +248,17 @@ AUTOTUNE_EVENT_ACTION_MAP = {
     AUTOTUNE_EVENT_ROLLED_BACK: "rolled_back",
     AUTOTUNE_EVENT_EVALUATED: "evaluated",
 }
+AUTOTUNE_PROPOSAL_ID_PREFIX = "atp_"
+AUTOTUNE_FINGERPRINT_PREFIX = "gatfp_"
 AUTOTUNE_DECISION_ACTIONS = {"reviewed", "applied", "rejected"}
 AUTOTUNE_STATUS_ACTIONS = {"proposed", "reviewed", "applied", "rejected", "rolled_back"}
 
 
+def _now() -> datetime:
+    """Current local time; the single clock the router reads, so tests can pin it."""
+    return datetime.now()
+
+
 def _coerce_int(value: Any, default: int, min_value: int = 1, max_value: int = 365) -> int:
     try:
         parsed = int(value)
@@ -280,52 +309,74 @@ def _guardian_config_defaults() -> Dict[str, Any]:
     }
 
 
-def _guardian_autotune_defaults() -> Dict[str, Any]:
-    return {
+# Only read field-by-field by the normalizers below, so share one read-only copy.
+_GUARDIAN_AUTOTUNE_DEFAULTS = MappingProxyType(
+    {
         "enabled": False,
         "mode": "shadow",
         "llm_enabled": True,
-        "trigger": {
-            "lookback_days": 7,
-            "min_event_count": 20,
-            "cooldown_hours": 24,
-        },
-        "guardrails": {
-            "max_int_step": 1,
-            "max_float_step": 0.05,
-            "min_confidence": 0.55,
-        },
-        "auto_evaluate": {
-            "enabled": True,
-            "horizon_hours": 48,
-            "lookback_days": 90,
-            "max_targets_per_cycle": 3,
-        },
+        "trigger": MappingProxyType(
+            {
+                "lookback_days": 7,
+                "min_event_count": 20,
+                "cooldown_hours": 24,
+            }
+        ),
+        "guardrails": MappingProxyType(
+            {
+                "max_int_step": 1,
+                "max_float_step": 0.05,
+                "min_confidence": 0.55,
+            }
+        ),
+        "auto_evaluate": MappingProxyType(
+            {
+                "enabled": True,
+                "horizon_hours": 48,
+                "lookback_days": 90,
+                "max_targets_per_cycle": 3,
+            }
+        ),
     }
+)
 
-
-def _guardian_boundaries_defaults() -> Dict[str, Any]:
-    return {
+_GUARDIAN_BOUNDARIES_DEFAULTS = MappingProxyType(
+    {
         "reminder_frequency": "balanced",
         "reminder_channel": "in_app",
-        "quiet_hours": {
-            "enabled": True,
-            "start_hour": 22,
-            "end_hour": 8,
-            "timezone": "local",
-        },
+        "quiet_hours": MappingProxyType(
+            {
+                "enabled": True,
+                "start_hour": 22,
+                "end_hour": 8,
+                "timezone": "local",
+            }
+        ),
     }
+)
 
 
 def _load_blueprint_yaml() -> Dict[str, Any]:
-    if not BLUEPRINT_CONFIG_PATH.exists():
-        return {}
+    # Parsed once per (mtime, size). The _save_* helpers only replace top-level sections
+    # and the normalizers only read, so a one-level copy keeps the cached parse intact.
+    data = load_yaml_with_cache(BLUEPRINT_CONFIG_PATH)
+    return dict(data) if isinstance(data, dict) else {}
+
+
+def _write_blueprint_yaml(data: Dict[str, Any]) -> None:
+    # Dump to a sibling temp file and swap it in, so a failed or interrupted dump
+    # never leaves a truncated blueprint behind.
+    BLUEPRINT_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = BLUEPRINT_CONFIG_PATH.with_name(f"{BLUEPRINT_CONFIG_PATH.name}.tmp")
     try:
-        with open(BLUEPRINT_CONFIG_PATH, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        return data if isinstance(data, dict) else {}
-    except Exception:
-        return {}
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            yaml.dump(data, f, Dumper=YamlSafeDumper, allow_unicode=True, sort_keys=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, BLUEPRINT_CONFIG_PATH)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    clear_cache(BLUEPRINT_CONFIG_PATH)
 
 
 def _normalized_guardian_config(raw: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -461,16 +512,20 @@ def _normalized_guardian_config(raw: Optional[Dict[str, Any]] = None) -> Dict[st
     }
 
 
+def _normalized_autotune_mode(raw_autotune: Dict[str, Any]) -> str:
+    default_mode = _GUARDIAN_AUTOTUNE_DEFAULTS["mode"]
+    mode = str(raw_autotune.get("mode", default_mode)).strip().lower()
+    return mode if mode in ALLOWED_GUARDIAN_AUTOTUNE_MODES else default_mode
+
+
 def _normalized_guardian_autotune_config(raw: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    defaults = _guardian_autotune_defaults()
+    defaults = _GUARDIAN_AUTOTUNE_DEFAULTS
     raw = raw if isinstance(raw, dict) else {}
     raw_autotune = raw.get("guardian_autotune", {})
     if not isinstance(raw_autotune, dict):
         raw_autotune = {}
 
-    mode = str(raw_autotune.get("mode", defaults["mode"])).strip().lower()
-    if mode not in ALLOWED_GUARDIAN_AUTOTUNE_MODES:
-        mode = defaults["mode"]
+    mode = _normalized_autotune_mode(raw_autotune)
 
     raw_trigger = raw_autotune.get("trigger", {})
     if not isinstance(raw_trigger, dict):
@@ -559,7 +614,7 @@ def _normalized_guardian_autotune_config(raw: Optional[Dict[str, Any]] = None) -
 
 
 def _normalized_guardian_boundaries_config(raw: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    defaults = _guardian_boundaries_defaults()
+    defaults = _GUARDIAN_BOUNDARIES_DEFAULTS
     raw = raw if isinstance(raw, dict) else {}
     raw_boundaries = raw.get("guardian_boundaries", {})
     if not isinstance(raw_boundaries, dict):
@@ -622,9 +677,7 @@ def _save_guardian_config(config_payload: Dict[str, Any]) -> None:
         "escalation": authority_payload.get("escalation", {}),
         "safe_mode": authority_payload.get("safe_mode", {}),
     }
-    BLUEPRINT_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(BLUEPRINT_CONFIG_PATH, "w", encoding="utf-8") as f:
-        yaml.safe_dump(existing, f, allow_unicode=True, sort_keys=False)
+    _write_blueprint_yaml(existing)
 
 
 def _save_guardian_autotune_config(config_payload: Dict[str, Any]) -> None:
@@ -646,9 +699,7 @@ def _save_guardian_autotune_config(config_payload: Dict[str, Any]) -> None:
         )
         or {},
     }
-    BLUEPRINT_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(BLUEPRINT_CONFIG_PATH, "w", encoding="utf-8") as f:
-        yaml.safe_dump(existing, f, allow_unicode=True, sort_keys=False)
+    _write_blueprint_yaml(existing)
 
 
 def _save_guardian_boundaries_config(config_payload: Dict[str, Any]) -> None:
@@ -663,9 +714,7 @@ def _save_guardian_boundaries_config(config_payload: Dict[str, Any]) -> None:
         )
         or {},
     }
-    BLUEPRINT_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(BLUEPRINT_CONFIG_PATH, "w", encoding="utf-8") as f:
-        yaml.safe_dump(existing, f, allow_unicode=True, sort_keys=False)
+    _write_blueprint_yaml(existing)
 
 
 def _anchor_payload(anchor) -> dict:
@@ -708,45 +757,41 @@ def _anchor_diff_payload(diff) -> dict:
 
 
 def _load_latest_event(event_type: str) -> Optional[dict]:
-    if not EVENT_LOG_PATH.exists():
-        return None
-    with open(EVENT_LOG_PATH, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-    for raw in reversed(lines):
-        line = raw.strip()
-        if not line:
-            continue
-        try:
-            event = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if event.get("type") == event_type:
-            return event
-    return None
+    event = get_event_log_cache(EVENT_LOG_PATH).get_latest_by_type().get(event_type)
+    return copy.deepcopy(event) if event is not None else None
 
 
-def _parse_event_timestamp(raw_ts: Any) -> Optional[datetime]:
-    if not isinstance(raw_ts, str) or not raw_ts.strip():
-        return None
+@lru_cache(maxsize=4096)
+def _parse_iso_timestamp(raw_ts: str) -> Optional[datetime]:
     try:
         return datetime.fromisoformat(raw_ts.replace("Z", "+00:00")).replace(tzinfo=None)
     except ValueError:
         return None
 
 
+def _parse_event_timestamp(raw_ts: Any) -> Optional[datetime]:
+    if not isinstance(raw_ts, str) or not raw_ts.strip():
+        return None
+    # The same event timestamps are parsed repeatedly across history, cooldown and
+    # evaluation scans; datetimes are immutable, so memoize per string.
+    return _parse_iso_timestamp(raw_ts)
+
+
 def _load_events_for_days(days: int) -> list:
     if not EVENT_LOG_PATH.exists():
         return []
-    cutoff = datetime.now() - timedelta(days=max(1, int(days)))
+    cutoff = _now() - timedelta(days=max(1, int(days)))
     events = []
-    with open(EVENT_LOG_PATH, "r", encoding="utf-8") as f:
+    # Stream raw bytes straight into the decoder; no per-line str decode, and the
+    # log never has to fit in memory at once.
+    with open(EVENT_LOG_PATH, "rb", buffering=1 << 16) as f:
         for line in f:
             raw = line.strip()
             if not raw:
                 continue
             try:
-                event = json.loads(raw)
-            except json.JSONDecodeError:
+                event = decode_event_line(raw)
+            except ValueError:
                 continue
             ev_time = _parse_event_timestamp(event.get("timestamp"))
             if ev_time is None or ev_time >= cutoff:
@@ -795,8 +840,8 @@ def _load_latest_autotune_event(
         if not line:
             continue
         try:
-            event = json.loads(line)
-        except json.JSONDecodeError:
+            event = decode_event_line(line)
+        except ValueError:
             continue
         if event.get("type") != event_type:
             continue
@@ -846,17 +891,7 @@ def _find_autotune_rollback_within_horizon(
     return matched
 
 
-def _is_autotune_apply_already_evaluated(
-    *,
-    proposal_id: str,
-    fingerprint: str,
-    applied_at: str,
-) -> bool:
-    latest_evaluated = _load_latest_autotune_event(
-        AUTOTUNE_EVENT_EVALUATED,
-        proposal_id=proposal_id or None,
-        fingerprint=fingerprint or None,
-    )
+def _evaluation_covers_apply(latest_evaluated: Any, *, applied_at: str) -> bool:
     if not isinstance(latest_evaluated, dict):
         return False
     payload = latest_evaluated.get("payload")
@@ -884,10 +919,20 @@ def _pending_autotune_evaluation_targets(
     lookback_days: int = 90,
     limit: int = 3,
 ) -> List[Dict[str, Any]]:
-    now = datetime.now()
+    now = _now()
     horizon = timedelta(hours=_coerce_int(horizon_hours, 48, min_value=1, max_value=168))
     max_targets = _coerce_int(limit, 3, min_value=1, max_value=20)
     events = _load_events_for_days(_coerce_int(lookback_days, 90, min_value=1, max_value=365))
+    # Index the latest evaluation per identity from the window already in memory instead of
+    # rescanning the full log once per applied event.
+    latest_evaluated: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for event in events:
+        if event.get("type") == AUTOTUNE_EVENT_EVALUATED:
+            identity = _autotune_event_identity(
+                event.get("payload"),
+                fallback_timestamp=event.get("timestamp"),
+            )
+            latest_evaluated[identity] = event
     targets: List[Dict[str, Any]] = []
     seen_keys = set()
     for event in reversed(events):
@@ -909,11 +954,7 @@ def _pending_autotune_evaluation_targets(
             continue
         if now < applied_at_time + horizon:
             continue
-        if _is_autotune_apply_already_evaluated(
-            proposal_id=proposal_id,
-            fingerprint=fingerprint,
-            applied_at=applied_at,
-        ):
+        if _evaluation_covers_apply(latest_evaluated.get(key), applied_at=applied_at):
             continue
         targets.append(
             {
@@ -1093,7 +1134,7 @@ def _autotune_lifecycle_history_chains(days: int) -> List[Dict[str, Any]]:
         chain["latest_timestamp"] = timestamp
         chain["_latest_time"] = parsed_time
 
-    now = datetime.now()
+    now = _now()
     normalized_chains: List[Dict[str, Any]] = []
     for chain in chains.values():
         proposed_time = chain.get("_proposed_time")
@@ -1296,85 +1337,78 @@ def _build_autotune_operational_metrics(
         "rejected": 0,
         "rolled_back": 0,
     }
+    # Single pass over the chains; every metric below is derived from these accumulators.
+    review_values: List[float] = []
+    apply_evaluated = 0
+    apply_evaluable = 0
+    apply_successful = 0
+    apply_pending = 0
+    applied_count = 0
+    rollback_count = 0
+    trust_values: List[float] = []
+    trust_record_count = 0
+    trust_pending = 0
+    trust_unavailable = 0
     for chain in chains:
         status = str(chain.get("status") or "").strip()
         if status in status_counts:
             status_counts[status] += 1
 
-    review_values = [
-        float(chain["review_turnaround_hours"])
-        for chain in chains
-        if isinstance(chain.get("review_turnaround_hours"), (int, float))
-    ]
+        review_hours = chain.get("review_turnaround_hours")
+        if isinstance(review_hours, (int, float)):
+            review_values.append(float(review_hours))
+
+        apply_evaluation = chain.get("apply_evaluation")
+        if isinstance(apply_evaluation, dict):
+            apply_evaluated += 1
+            success = apply_evaluation.get("success_within_48h")
+            if isinstance(success, bool):
+                apply_evaluable += 1
+                if success is True:
+                    apply_successful += 1
+            if apply_evaluation.get("status") == "pending_48h_window":
+                apply_pending += 1
+
+        if chain.get("applied_at"):
+            applied_count += 1
+            if chain.get("rolled_back_at"):
+                rollback_count += 1
+
+        trust_record = chain.get("trust_delta_48h")
+        if isinstance(trust_record, dict):
+            trust_record_count += 1
+            delta = trust_record.get("delta")
+            if isinstance(delta, (int, float)):
+                trust_values.append(float(delta))
+            trust_status = trust_record.get("status")
+            if trust_status == "pending_48h_window":
+                trust_pending += 1
+            elif trust_status == "unavailable":
+                trust_unavailable += 1
+
     review_turnaround = {
         "samples": len(review_values),
         "median_hours": _median(review_values),
     }
-
-    apply_evaluations = [
-        chain.get("apply_evaluation")
-        for chain in chains
-        if isinstance(chain.get("apply_evaluation"), dict)
-    ]
-    evaluable = [
-        item
-        for item in apply_evaluations
-        if isinstance(item.get("success_within_48h"), bool)
-    ]
     apply_success_rate = {
-        "applied": len(apply_evaluations),
-        "evaluable": len(evaluable),
-        "successful": sum(1 for item in evaluable if item.get("success_within_48h") is True),
-        "pending": sum(
-            1
-            for item in apply_evaluations
-            if item.get("status") == "pending_48h_window"
-        ),
-        "rate": None,
+        "applied": apply_evaluated,
+        "evaluable": apply_evaluable,
+        "successful": apply_successful,
+        "pending": apply_pending,
+        "rate": round(apply_successful / apply_evaluable, 2) if apply_evaluable > 0 else None,
         "horizon_hours": 48,
     }
-    if apply_success_rate["evaluable"] > 0:
-        apply_success_rate["rate"] = round(
-            apply_success_rate["successful"] / apply_success_rate["evaluable"],
-            2,
-        )
-
-    applied_count = sum(1 for chain in chains if chain.get("applied_at"))
-    rollback_count = sum(
-        1
-        for chain in chains
-        if chain.get("applied_at") and chain.get("rolled_back_at")
-    )
     rollback_rate = {
         "applied": applied_count,
         "rolled_back": rollback_count,
         "rate": round(rollback_count / applied_count, 2) if applied_count > 0 else None,
     }
-
-    trust_records = [
-        chain.get("trust_delta_48h")
-        for chain in chains
-        if isinstance(chain.get("trust_delta_48h"), dict)
-    ]
-    trust_values = [
-        float(item["delta"])
-        for item in trust_records
-        if isinstance(item.get("delta"), (int, float))
-    ]
     trust_delta = {
         "samples": len(trust_values),
         "average_delta": round(sum(trust_values) / len(trust_values), 3) if trust_values else None,
-        "pending": sum(
-            1
-            for item in trust_records
-            if item.get("status") == "pending_48h_window"
-        ),
-        "unavailable": sum(
-            1
-            for item in trust_records
-            if item.get("status") == "unavailable"
-        ),
-        "status": "ready" if trust_values else "pending" if trust_records else "unavailable",
+        "pending": trust_pending,
+        "unavailable": trust_unavailable,
+        "status": "ready" if trust_values else "pending" if trust_record_count else "unavailable",
         "horizon_hours": 48,
     }
 
@@ -1434,11 +1468,11 @@ def _normalize_autotune_source(value: Optional[str]) -> str:
 
 
 def _current_autotune_mode() -> str:
-    config = _normalized_guardian_autotune_config(_load_blueprint_yaml())
-    mode = str(config.get("mode") or "shadow").strip().lower()
-    if mode in ALLOWED_GUARDIAN_AUTOTUNE_MODES:
-        return mode
-    return "shadow"
+    # Called several times per autotune request; read just the mode instead of
+    # normalizing the whole autotune section each time.
+    raw = _load_blueprint_yaml()
+    raw_autotune = raw.get("guardian_autotune") if isinstance(raw, dict) else None
+    return _normalized_autotune_mode(raw_autotune if isinstance(raw_autotune, dict) else {})
 
 
 def _ensure_autotune_mode(*allowed_modes: str) -> str:
@@ -1525,15 +1559,15 @@ def _build_autotune_proposal_fingerprint(proposal_payload: Dict[str, Any]) -> st
     }
     serialized = json.dumps(canonical, ensure_ascii=False, sort_keys=True)
     digest = hashlib.sha1(serialized.encode("utf-8")).hexdigest()[:16]
-    return f"gatfp_{digest}"
+    return f"{AUTOTUNE_FINGERPRINT_PREFIX}{digest}"
 
 
 def _proposal_id_from_timestamp(raw_ts: Any) -> str:
     if isinstance(raw_ts, str):
         digits = "".join(ch for ch in raw_ts if ch.isdigit())
         if digits:
-            return f"atp_{digits[:14]}"
-    return f"atp_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            return f"{AUTOTUNE_PROPOSAL_ID_PREFIX}{digits[:14]}"
+    return f"{AUTOTUNE_PROPOSAL_ID_PREFIX}{_now().strftime('%Y%m%d%H%M%S')}"
 
 
 def _ensure_autotune_proposal_identity(
@@ -1958,7 +1992,7 @@ def _build_autotune_patch(
 
 
 def _run_guardian_autotune_shadow(trigger: str = "manual") -> Dict[str, Any]:
-    now = datetime.now()
+    now = _now()
     raw = _load_blueprint_yaml()
     config_payload = _normalized_guardian_autotune_config(raw)
     mode = str(config_payload.get("mode") or "shadow").strip().lower()
@@ -2055,7 +2089,7 @@ def _run_guardian_autotune_shadow(trigger: str = "manual") -> Dict[str, Any]:
 
     proposal = _ensure_autotune_proposal_identity(
         {
-            "proposal_id": f"atp_{now.strftime('%Y%m%d%H%M%S')}",
+            "proposal_id": f"{AUTOTUNE_PROPOSAL_ID_PREFIX}{now.strftime('%Y%m%d%H%M%S')}",
             "lifecycle_status": "proposed",
             "trigger": str(trigger or "manual"),
             "lookback_days": lookback_days,
@@ -2152,8 +2186,13 @@ async def _run_guardian_autotune_auto_evaluate(trigger: str = "cycle") -> Dict[s
             "targets": [],
         }
 
+    # Evaluated events are only appended after the loop, so the retrospective behind the
+    # trust index cannot change between targets; every due target reads it, so build it
+    # once up front.
+    cycle_trust_index = _current_human_trust_index(days=7)
     evaluations = []
     errors = []
+    evaluated_events = []
     for target in targets:
         request = GuardianAutoTuneLifecycleActionRequest(
             proposal_id=target.get("proposal_id"),
@@ -2165,16 +2204,19 @@ async def _run_guardian_autotune_auto_evaluate(trigger: str = "cycle") -> Dict[s
             force=False,
         )
         try:
-            result = await evaluate_guardian_autotune_lifecycle(request)
-            evaluations.append(
-                {
-                    "proposal_id": target.get("proposal_id"),
-                    "fingerprint": target.get("fingerprint"),
-                    "applied_at": target.get("applied_at"),
-                    "status": result.get("status"),
-                    "evaluation": result.get("evaluation"),
-                }
+            result, event = _evaluate_autotune_apply(
+                request, load_trust_index=lambda: cycle_trust_index
             )
+            evaluation = {
+                "proposal_id": target.get("proposal_id"),
+                "fingerprint": target.get("fingerprint"),
+                "applied_at": target.get("applied_at"),
+                "status": result.get("status"),
+                "evaluation": result.get("evaluation"),
+            }
+            if event is not None:
+                evaluated_events.append((evaluation, event))
+            evaluations.append(evaluation)
         except HTTPException as exc:
             errors.append(
                 {
@@ -2194,6 +2236,26 @@ async def _run_guardian_autotune_auto_evaluate(trigger: str = "cycle") -> Dict[s
                 }
             )
 
+    if evaluated_events:
+        # One write for the whole cycle instead of one append per evaluated target.
+        try:
+            append_events([event for _, event in evaluated_events])
+        except Exception as exc:
+            # Nothing from the batch was recorded: report those targets as errors,
+            # as a failed per-target append would have.
+            unsaved = [evaluation for evaluation, _ in evaluated_events]
+            unsaved_ids = {id(evaluation) for evaluation in unsaved}
+            evaluations = [item for item in evaluations if id(item) not in unsaved_ids]
+            for evaluation in unsaved:
+                errors.append(
+                    {
+                        "proposal_id": evaluation.get("proposal_id"),
+                        "fingerprint": evaluation.get("fingerprint"),
+                        "status_code": 500,
+                        "detail": str(exc),
+                    }
+                )
+
     status = "completed"
     if evaluations and errors:
         status = "partial"
@@ -2359,7 +2421,7 @@ def _has_review_due_this_week() -> bool:
         return False
     from datetime import timedelta
 
-    today = datetime.now().date()
+    today = _now().date()
     week_start = today - timedelta(days=today.weekday())
     week_end = week_start + timedelta(days=6)
     with open(EVENT_LOG_PATH, "r", encoding="utf-8") as f:
@@ -2645,7 +2707,7 @@ async def get_state():
         "audit": state_audit,
         "meta": {
             "event_schema_version": EVENT_SCHEMA_VERSION,
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": _now().isoformat(),
         },
     }
 
@@ -2750,7 +2812,7 @@ def _maybe_append_safe_mode_transition(
         append_event(
             {
                 "type": "guardian_safe_mode_entered",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now().isoformat(),
                 "payload": {
                     "days": days,
                     "fingerprint": fingerprint,
@@ -2770,7 +2832,7 @@ def _maybe_append_safe_mode_transition(
         append_event(
             {
                 "type": "guardian_safe_mode_exited",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now().isoformat(),
                 "payload": {
                     "days": days,
                     "fingerprint": fingerprint,
@@ -2879,7 +2941,7 @@ def _apply_guardian_intervention_response(
         append_event(
             {
                 "type": "guardian_intervention_confirmed",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now().isoformat(),
                 "payload": base_payload,
             }
         )
@@ -2887,7 +2949,7 @@ def _apply_guardian_intervention_response(
         append_event(
             {
                 "type": "guardian_intervention_responded",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now().isoformat(),
                 "payload": {**base_payload, "action": action},
             }
         )
@@ -2933,12 +2995,12 @@ async def confirm_retrospective_intervention(request: RetrospectiveConfirmReques
 
 @router.post("/l2/session/start")
 async def start_l2_session(request: L2SessionActionRequest):
-    session_id = request.session_id or f"l2_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    session_id = request.session_id or f"l2_{_now().strftime('%Y%m%d%H%M%S')}"
     intention = str(request.intention or "").strip()
     append_event(
         {
             "type": "l2_session_started",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now().isoformat(),
             "payload": {
                 "session_id": session_id,
                 "source": "manual",
@@ -2963,7 +3025,7 @@ async def resume_l2_session(request: L2SessionActionRequest):
     append_event(
         {
             "type": "l2_session_resumed",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now().isoformat(),
             "payload": {
                 "session_id": session_id,
                 "source": "manual",
@@ -2988,7 +3050,7 @@ async def interrupt_l2_session(request: L2SessionActionRequest):
     append_event(
         {
             "type": "l2_session_interrupted",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now().isoformat(),
             "payload": {
                 "session_id": session_id,
                 "reason": reason,
@@ -3014,7 +3076,7 @@ async def complete_l2_session(request: L2SessionActionRequest):
     append_event(
         {
             "type": "l2_session_completed",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now().isoformat(),
             "payload": {
                 "session_id": session_id,
                 "source": "manual",
@@ -3130,7 +3192,7 @@ async def update_guardian_config(request: GuardianConfigUpdateRequest):
     append_event(
         {
             "type": "guardian_config_updated",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now().isoformat(),
             "payload": payload,
         }
     )
@@ -3169,13 +3231,13 @@ async def exit_safe_mode(request: SafeModeExitRequest = SafeModeExitRequest()):
     if entered_at:
         try:
             entered_time = datetime.fromisoformat(str(entered_at).replace("Z", "+00:00")).replace(tzinfo=None)
-            duration_hours = (datetime.now() - entered_time).total_seconds() / 3600
+            duration_hours = (_now() - entered_time).total_seconds() / 3600
         except Exception:
             pass
 
     event = {
         "type": "safe_mode_exited",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now().isoformat(),
         "payload": {
             "reason": request.reason,
             "entered_at": entered_at,
@@ -3187,7 +3249,7 @@ async def exit_safe_mode(request: SafeModeExitRequest = SafeModeExitRequest()):
     return {
         "status": "success",
         "message": "Safe Mode exited successfully",
-        "exited_at": datetime.now().isoformat(),
+        "exited_at": _now().isoformat(),
         "duration_hours": round(duration_hours, 2) if duration_hours else None,
     }
 
@@ -3231,7 +3293,7 @@ async def update_guardian_boundaries_config(request: GuardianBoundariesConfigUpd
     append_event(
         {
             "type": "guardian_boundaries_config_updated",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now().isoformat(),
             "payload": payload,
         }
     )
@@ -3295,7 +3357,7 @@ async def update_guardian_autotune_config(request: GuardianAutoTuneConfigUpdateR
     append_event(
         {
             "type": "guardian_autotune_config_updated",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now().isoformat(),
             "payload": payload,
         }
     )
@@ -3382,7 +3444,7 @@ async def review_guardian_autotune_lifecycle(request: GuardianAutoTuneLifecycleA
     append_event(
         {
             "type": AUTOTUNE_EVENT_REVIEWED,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now().isoformat(),
             "payload": payload,
         }
     )
@@ -3428,11 +3490,11 @@ async def apply_guardian_autotune_lifecycle(request: GuardianAutoTuneLifecycleAc
     )
     payload["trust_index_before"] = _current_human_trust_index(days=7)
     payload["trust_index_after_48h"] = None
-    payload["snapshot_id"] = f"ats_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    payload["snapshot_id"] = f"ats_{_now().strftime('%Y%m%d%H%M%S')}"
     append_event(
         {
             "type": AUTOTUNE_EVENT_APPLIED,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now().isoformat(),
             "payload": payload,
         }
     )
@@ -3470,7 +3532,7 @@ async def reject_guardian_autotune_lifecycle(request: GuardianAutoTuneLifecycleA
     append_event(
         {
             "type": AUTOTUNE_EVENT_REJECTED,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now().isoformat(),
             "payload": payload,
         }
     )
@@ -3483,8 +3545,15 @@ async def reject_guardian_autotune_lifecycle(request: GuardianAutoTuneLifecycleA
     }
 
 
-@router.post("/guardian/autotune/lifecycle/evaluate")
-async def evaluate_guardian_autotune_lifecycle(request: GuardianAutoTuneLifecycleActionRequest):
+def _evaluate_autotune_apply(
+    request: GuardianAutoTuneLifecycleActionRequest,
+    *,
+    load_trust_index: Optional[Callable[[], Optional[float]]] = None,
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Evaluate the targeted apply; returns the response body and the event to append, if any.
+
+    `load_trust_index` lets a caller evaluating several applies share one trust index read.
+    """
     mode = _ensure_autotune_mode("assist")
     requested_id = str(request.proposal_id or "").strip()
     requested_fingerprint = str(request.fingerprint or "").strip()
@@ -3535,7 +3604,7 @@ async def evaluate_guardian_autotune_lifecycle(request: GuardianAutoTuneLifecycl
     if not isinstance(auto_evaluate_cfg, dict):
         auto_evaluate_cfg = {}
     horizon_hours = _coerce_int(auto_evaluate_cfg.get("horizon_hours"), 48, 6, 168)
-    now = datetime.now()
+    now = _now()
     evaluable_at = applied_at + timedelta(hours=horizon_hours)
     if now < evaluable_at and not request.force:
         return {
@@ -3548,8 +3617,7 @@ async def evaluate_guardian_autotune_lifecycle(request: GuardianAutoTuneLifecycl
                 "applied_at": latest_applied.get("timestamp"),
                 "evaluable_at": evaluable_at.isoformat(),
             },
-            "lifecycle": _autotune_lifecycle_state_snapshot(),
-        }
+        }, None
 
     latest_evaluated = _load_latest_autotune_event(
         AUTOTUNE_EVENT_EVALUATED,
@@ -3563,8 +3631,7 @@ async def evaluate_guardian_autotune_lifecycle(request: GuardianAutoTuneLifecycl
             "proposal_id": proposal_id,
             "fingerprint": fingerprint,
             "evaluation": latest_evaluated.get("payload"),
-            "lifecycle": _autotune_lifecycle_state_snapshot(),
-        }
+        }, None
 
     actor = _normalize_autotune_actor(request.actor)
     source = _normalize_autotune_source(request.source)
@@ -3574,7 +3641,9 @@ async def evaluate_guardian_autotune_lifecycle(request: GuardianAutoTuneLifecycl
         if isinstance(trust_before_raw, (int, float))
         else None
     )
-    trust_after = _current_human_trust_index(days=7)
+    trust_after = (
+        load_trust_index() if load_trust_index is not None else _current_human_trust_index(days=7)
+    )
     trust_delta = (
         round(trust_after - trust_before, 3)
         if isinstance(trust_before, float) and isinstance(trust_after, float)
@@ -3635,21 +3704,27 @@ async def evaluate_guardian_autotune_lifecycle(request: GuardianAutoTuneLifecycl
         "success_within_48h": success_within_48h,
         "rollback_timestamp": rollback_timestamp,
     }
-    append_event(
-        {
-            "type": AUTOTUNE_EVENT_EVALUATED,
-            "timestamp": now.isoformat(),
-            "payload": eval_payload,
-        }
-    )
+    event = {
+        "type": AUTOTUNE_EVENT_EVALUATED,
+        "timestamp": now.isoformat(),
+        "payload": eval_payload,
+    }
     return {
         "status": "evaluated",
         "mode": mode,
         "proposal_id": proposal_id,
         "fingerprint": fingerprint,
         "evaluation": eval_payload,
-        "lifecycle": _autotune_lifecycle_state_snapshot(),
-    }
+    }, event
+
+
+@router.post("/guardian/autotune/lifecycle/evaluate")
+async def evaluate_guardian_autotune_lifecycle(request: GuardianAutoTuneLifecycleActionRequest):
+    result, event = _evaluate_autotune_apply(request)
+    if event is not None:
+        append_event(event)
+    result["lifecycle"] = _autotune_lifecycle_state_snapshot()
+    return result
 
 
 @router.post("/guardian/autotune/lifecycle/rollback")
@@ -3716,7 +3791,7 @@ async def rollback_guardian_autotune_lifecycle(request: GuardianAutoTuneLifecycl
         after=rollback_target,
         event_action="rollback",
     )
-    payload["snapshot_id"] = f"ats_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    payload["snapshot_id"] = f"ats_{_now().strftime('%Y%m%d%H%M%S')}"
     payload["rollback_of"] = {
         "event_type": AUTOTUNE_EVENT_APPLIED,
         "timestamp": latest_applied.get("timestamp"),
@@ -3724,7 +3799,7 @@ async def rollback_guardian_autotune_lifecycle(request: GuardianAutoTuneLifecycl
     append_event(
         {
             "type": AUTOTUNE_EVENT_ROLLED_BACK,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now().isoformat(),
             "payload": payload,
         }
     )
@@ -3801,7 +3876,7 @@ async def activate_anchor(request: AnchorActivateRequest):
     append_event(
         {
             "type": "anchor_activated",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now().isoformat(),
             "payload": {
                 "version": activated.version,
                 "source_hash": activated.source_hash,
@@ -3814,7 +3889,7 @@ async def activate_anchor(request: AnchorActivateRequest):
     append_event(
         {
             "type": "goal_alignment_recomputed",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now().isoformat(),
             "payload": {
                 "anchor_version": activated.version,
                 **recompute_result,
@@ -3921,7 +3996,7 @@ async def submit_feedback(goal_id: str, request: FeedbackRequest):
         {
             "type": "goal_feedback",
             "goal_id": goal_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now().isoformat(),
             "payload": {
                 "intent": result.intent.value,
                 "confidence": result.confidence,
@@ -3954,7 +4029,7 @@ async def execute_action(goal_id: str, request: ActionRequest):
         {
             "type": "goal_action",
             "goal_id": goal_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now().isoformat(),
             "payload": {"action": action_type, "reason": request.reason},
         }
     )
@@ -3964,7 +4039,7 @@ async def execute_action(goal_id: str, request: ActionRequest):
             {
                 "type": "goal_completed",
                 "goal_id": goal_id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now().isoformat(),
             }
         )
 
@@ -3977,7 +4052,7 @@ async def get_timeline():
     registry_goals = [g for g in steward.registry.goals if g.state == GoalState.ACTIVE]
 
     timeline_items = []
-    current_hour = datetime.now().hour
+    current_hour = _now().hour
     for idx, goal in enumerate(registry_goals):
         timeline_items.append(
             {
@@ -4047,7 +4122,7 @@ async def trigger_cycle():
         append_event(
             {
                 "type": AUTOTUNE_EVENT_AUTO_EVALUATE_CYCLE,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now().isoformat(),
                 "payload": {
                     "trigger": "cycle",
                     "status": autotune_evaluation.get("status"),
@@ -4106,7 +4181,7 @@ async def interact(request: InteractionRequest):
         append_event(
             {
                 "type": "identity_updated",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now().isoformat(),
                 "payload": result.updates,
             }
         )
@@ -4117,7 +4192,7 @@ async def interact(request: InteractionRequest):
                 {
                     "type": "goal_feedback",
                     "goal_id": goal_id,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": _now().isoformat(),
                     "payload": {
                         "intent": status,
                         "message": request.message,